@@ -133,10 +133,12 @@ def check_achievements(stats: Dict[str, int], unlocked_achievements: List[str])
         List of (achievement_id, xp_reward) tuples for newly unlocked achievements
     """
     newly_unlocked = []
+    # Set for O(1) membership checks across every achievement
+    unlocked = set(unlocked_achievements)
     
     for achievement_id, achievement_data in ACHIEVEMENTS.items():
         # Skip if already unlocked
-        if achievement_id in unlocked_achievements:
+        if achievement_id in unlocked:
             continue
         
         # Check if achievement condition is met
@@ -2,23 +2,39 @@
 
 import os
 import asyncio
+import atexit
+import functools
+import hashlib
+import json
 import logging
+import logging.handlers
+import queue
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from types import MappingProxyType
 import discord
 from discord.ext import commands
-from discord import utils
 from dotenv import load_dotenv
 from typing import Optional
 from game import Game
-from config_manager import ConfigManager
+from config_manager import ConfigManager, ConfigSnapshot
 from score_manager import ScoreManager
 from achievements import check_achievements, get_achievement_info
 from shop import ShopManager
 
-# Set up logging
+# Set up logging (records are queued and written to stderr by a background thread,
+# so logging from event handlers never blocks the event loop on I/O)
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_stream_handler = logging.StreamHandler()
+log_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = logging.handlers.QueueListener(log_queue, log_stream_handler)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Load environment variables
@@ -36,6 +52,8 @@ config_manager = ConfigManager()
 
 # Score manager
 score_manager = ScoreManager()
+# Write out score changes still waiting on the save delay
+atexit.register(score_manager.flush)
 
 # Shop manager
 shop_manager = ShopManager()
@@ -44,7 +62,10 @@ shop_manager = ShopManager()
 active_games: dict[int, Game] = {}
 
 # Store game players: {message_id: set of user_ids}
-game_players: dict[int, set[int]] = {}
+game_players: defaultdict[int, set[int]] = defaultdict(set)
+
+# Store games each user has joined: {user_id: set of message_ids} (reverse of game_players)
+user_active_games: defaultdict[int, set[int]] = defaultdict(set)
 
 # Store game owners: {message_id: user_id} (who created the game)
 game_owners: dict[int, int] = {}
@@ -55,8 +76,297 @@ user_levels: dict[int, int] = {}
 # Store server configs in memory: {guild_id: emoji_config}
 server_configs: dict[int, dict] = {}
 
-# Store previous death counts per game: {message_id: {user_id: death_count}}
-previous_death_counts: dict[int, dict[int, int]] = {}
+# Store rendered "View All" config embeds: {guild_id: (config_version, embed)}
+view_all_embeds: dict[int, tuple[int, discord.Embed]] = {}
+
+# Discord embed description limit and game field rendering constants
+MAX_DESCRIPTION_LENGTH = 4096
+CODE_BLOCK_OVERHEAD = len("```\n\n```")  # ```\n and \n```
+FIELD_TOO_LARGE_WARNING = "\n\n⚠️ Field too large to display fully. Consider reducing field size in settings."
+
+# Fallback shown for emojis missing from a configuration
+UNKNOWN_EMOJI = "❓"
+
+# Game embed colors by game state
+GAME_ACTIVE_COLOR = discord.Color.green()
+LEVEL_COMPLETE_COLOR = discord.Color.gold()
+GAME_OVER_COLOR = discord.Color.red()
+
+# Store display names of users fetched over REST: {user_id: display_name}
+fetched_display_names: dict[int, str] = {}
+MAX_FETCHED_DISPLAY_NAMES = 1000
+
+# Store scheduled game message edits: {message_id: Task}, kept until the edit finishes
+pending_edits: dict[int, asyncio.Task] = {}
+
+# Store games moved after their pending edit took its snapshot: {message_id}
+stale_game_edits: set[int] = set()
+
+# Store the last embed payload sent by a debounced edit: {message_id: embed dict}
+last_edit_payloads: dict[int, dict] = {}
+EDIT_DEBOUNCE_SECONDS = 0.25
+
+# Store custom emoji lookups by name: {guild_id: {emoji_name: Emoji}}
+guild_emoji_by_name: dict[int, dict[str, discord.Emoji]] = {}
+
+# Cache per-server emojis and settings used by game events: {guild_id: GuildResources}
+# (guild_id 0 holds the defaults for servers without a loaded config)
+guild_resources: dict[int, "GuildResources"] = {}
+
+# File holding the hash of the slash commands at the last sync
+COMMAND_HASH_FILE = ".command_hash"
+
+# Rejection messages shared by the slash commands
+ADMIN_REQUIRED_MESSAGE = "❌ You need administrator permissions to use this command."
+GUILD_ONLY_MESSAGE = "❌ This command can only be used in a server."
+
+
+@dataclass
+class GuildResources:
+    """Emojis and settings for one server, resolved once and reused across game events."""
+    
+    __slots__ = ("emojis", "game_emojis", "item_types", "direction_by_key", "game_settings", "player_emojis", "heart_emoji", "skull_emoji", "join_emoji", "join_key", "uses_custom_emoji", "field_template", "max_field_length", "lives_displays")
+    
+    emojis: dict
+    game_emojis: dict
+    item_types: dict
+    direction_by_key: dict
+    game_settings: dict
+    player_emojis: list
+    heart_emoji: str
+    skull_emoji: str
+    join_emoji: str
+    join_key: tuple
+    uses_custom_emoji: bool
+    field_template: str
+    max_field_length: int
+    lives_displays: tuple
+    
+    def lives_display(self, lives: int) -> str:
+        """Get the hearts shown for a player's remaining lives (skull when out of lives)."""
+        if lives <= 0:
+            return self.skull_emoji
+        if lives < len(self.lives_displays):
+            return self.lives_displays[lives]
+        # Power-ups can push lives past the precomputed range
+        return self.heart_emoji * lives
+
+
+def emoji_key(emoji) -> tuple:
+    """Key an emoji by (name, id), with id None for Unicode emojis."""
+    if isinstance(emoji, str):
+        return (emoji, None)
+    return (emoji.name, emoji.id)
+
+
+def config_emoji_key(emoji: str) -> tuple:
+    """Key a configured emoji string the same way as a reaction emoji."""
+    return emoji_key(discord.PartialEmoji.from_str(emoji))
+
+
+def build_guild_resources(guild_id: int) -> GuildResources:
+    """Resolve emojis and settings for a server from its configuration."""
+    emojis, item_types, game_settings, emoji_to_direction, player_emojis = config_manager.get_all(guild_id)
+    heart_emoji = emojis.get("heart", "❤️")
+    skull_emoji = emojis.get("skull", "💀")
+    join_emoji = emojis.get("join", "✅")
+    # Custom emojis don't render in code blocks (stored emojis are validated, so only custom ones start with "<")
+    uses_custom_emoji = any(
+        emoji[:1] == "<"
+        for emoji in [*emojis.values(), *item_types.values()]
+    )
+    return GuildResources(
+        emojis=emojis,
+        # Emoji dict for Game class
+        game_emojis={key: emojis[key] for key in ("wall", "obstacle", "empty", "player", "portal", "zombie")},
+        item_types=item_types,
+        # Movement directions keyed like reactions, so lookups skip formatting the emoji
+        direction_by_key={
+            config_emoji_key(emoji): direction
+            for emoji, direction in emoji_to_direction.items()
+        },
+        game_settings=game_settings,
+        player_emojis=player_emojis,
+        heart_emoji=heart_emoji,
+        skull_emoji=skull_emoji,
+        join_emoji=join_emoji,
+        join_key=config_emoji_key(join_emoji),
+        uses_custom_emoji=uses_custom_emoji,
+        # Use code block for Unicode emojis, plain text for custom emojis
+        field_template="{}" if uses_custom_emoji else "```\n{}\n```",
+        # Longest field render that still fits the embed description once wrapped
+        max_field_length=MAX_DESCRIPTION_LENGTH if uses_custom_emoji else MAX_DESCRIPTION_LENGTH - CODE_BLOCK_OVERHEAD,
+        # Lives display indexed by lives count, up to the configured starting lives
+        lives_displays=tuple([skull_emoji] + [heart_emoji * lives for lives in range(1, game_settings.get("player_lives", 3) + 1)]),
+    )
+
+
+def get_guild_resources(guild_id: Optional[int]) -> GuildResources:
+    """Get cached emojis and settings for a server, falling back to defaults if not configured."""
+    config_id = guild_id if guild_id and guild_id in server_configs else 0
+    resources = guild_resources.get(config_id)
+    if resources is None:
+        resources = build_guild_resources(config_id)
+        guild_resources[config_id] = resources
+    return resources
+
+
+def add_game_player(message_id: int, user_id: int) -> None:
+    """Record that a user joined a game, keeping the per-user index in sync."""
+    game_players[message_id].add(user_id)
+    user_active_games[user_id].add(message_id)
+
+
+def remove_game_player(message_id: int, user_id: int) -> None:
+    """Record that a user left a game, keeping the per-user index in sync."""
+    players = game_players.get(message_id)
+    if players is not None:
+        players.discard(user_id)
+    games = user_active_games.get(user_id)
+    if games is not None:
+        games.discard(message_id)
+        if not games:
+            del user_active_games[user_id]
+
+
+def drop_game_players(message_id: int) -> None:
+    """Forget all players of a game, keeping the per-user index in sync."""
+    for user_id in game_players.pop(message_id, ()):
+        games = user_active_games.get(user_id)
+        if games is not None:
+            games.discard(message_id)
+            if not games:
+                del user_active_games[user_id]
+
+
+async def get_display_name(user_id: int) -> str:
+    """Get a user's display name, preferring the client cache over a REST fetch."""
+    user = bot.get_user(user_id)
+    if user is not None:
+        return user.display_name
+    
+    display_name = fetched_display_names.get(user_id)
+    if display_name is None:
+        user = await bot.fetch_user(user_id)
+        display_name = user.display_name
+        # Drop the oldest entry once the cache is full
+        if len(fetched_display_names) >= MAX_FETCHED_DISPLAY_NAMES:
+            del fetched_display_names[next(iter(fetched_display_names))]
+        fetched_display_names[user_id] = display_name
+    return display_name
+
+
+def cleanup_game(message_id: int) -> None:
+    """Forget all state stored for a game message."""
+    cancel_game_edit(message_id)
+    active_games.pop(message_id, None)
+    drop_game_players(message_id)
+    game_owners.pop(message_id, None)
+
+
+async def flush_game_edit(message: discord.Message, resources: GuildResources, guild_id: Optional[int]) -> None:
+    """Edit a game message with its latest state once the debounce window closes."""
+    try:
+        await asyncio.sleep(EDIT_DEBOUNCE_SECONDS)
+        # Moves from here on are not in this edit's snapshot
+        stale_game_edits.discard(message.id)
+        game = active_games.get(message.id)
+        if game is None:
+            return
+        embed = create_game_embed(game, "🎮 Game", resources=resources, guild_id=guild_id)
+        payload = embed.to_dict()
+        # Moves that cancel out within the window leave nothing to send
+        if last_edit_payloads.get(message.id) == payload:
+            return
+        await message.edit(embed=embed)
+        last_edit_payloads[message.id] = payload
+    except discord.errors.NotFound:
+        logger.info(f"Game message {message.id} was deleted, cleaning up game")
+        cleanup_game(message.id)
+    except discord.errors.Forbidden:
+        logger.warning(f"Bot lacks permission for message {message.id}")
+    except Exception as e:
+        logger.error(f"Error updating game message {message.id}: {e}", exc_info=True)
+    finally:
+        # Stay pending until the edit lands so cancel_game_edit can still stop it
+        if pending_edits.get(message.id) is asyncio.current_task():
+            del pending_edits[message.id]
+            # Moves made while the edit was in flight need one more edit
+            if message.id in stale_game_edits and message.id in active_games:
+                schedule_game_edit(message, resources, guild_id)
+
+
+def schedule_game_edit(message: discord.Message, resources: GuildResources, guild_id: Optional[int]) -> None:
+    """Schedule a game message edit, unless one is already pending for it."""
+    if message.id in pending_edits:
+        stale_game_edits.add(message.id)
+    else:
+        stale_game_edits.discard(message.id)
+        pending_edits[message.id] = asyncio.create_task(flush_game_edit(message, resources, guild_id))
+
+
+def cancel_game_edit(message_id: int) -> None:
+    """Cancel a pending or in-flight game message edit, before the message is edited directly."""
+    task = pending_edits.pop(message_id, None)
+    # A failed edit cleans up its own game, and must not cancel itself
+    if task is not None and task is not asyncio.current_task():
+        task.cancel()
+    stale_game_edits.discard(message_id)
+    # The message is about to show something else
+    last_edit_payloads.pop(message_id, None)
+
+
+def get_command_tree_hash() -> str:
+    """Hash the global slash command payloads that a sync would upload."""
+    payloads = []
+    for command in bot.tree.get_commands():
+        try:
+            payloads.append(command.to_dict(bot.tree))
+        except TypeError:
+            # discord.py before 2.4 takes no tree argument
+            payloads.append(command.to_dict())
+    # Include the application so a different bot token forces a sync
+    data = json.dumps([bot.application_id, payloads], sort_keys=True, default=str)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def read_synced_command_hash() -> Optional[str]:
+    """Read the command tree hash stored at the last successful sync."""
+    try:
+        with open(COMMAND_HASH_FILE, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def write_synced_command_hash(command_hash: str) -> None:
+    """Store the command tree hash after a successful sync."""
+    try:
+        with open(COMMAND_HASH_FILE, 'w', encoding='utf-8') as f:
+            f.write(command_hash)
+    except OSError as e:
+        logger.warning(f"Could not save command hash: {e}")
+
+
+@bot.event
+async def setup_hook():
+    """Register persistent views before connecting."""
+    # One button per emoji key routes clicks from any /configure message, labels don't matter here
+    emoji_view = EmojiConfigView()
+    for key, label in EMOJI_LABELS.items():
+        emoji_view.add_emoji_button(key, label)
+    bot.add_view(emoji_view)
+
+
+async def load_guild_config(guild: discord.Guild) -> None:
+    """Load a server's configuration from disk in a worker thread."""
+    try:
+        # Store full config (emojis + settings)
+        server_configs[guild.id] = await asyncio.to_thread(config_manager.load_config, guild.id)
+        guild_resources[guild.id] = await asyncio.to_thread(build_guild_resources, guild.id)
+        logger.info(f"Loaded config for server: {guild.name} ({guild.id})")
+    except Exception as e:
+        logger.error(f"Error loading config for server {guild.id}: {e}", exc_info=True)
 
 
 @bot.event
@@ -64,18 +374,18 @@ async def on_ready():
     """Called when the bot is ready."""
     logger.info(f"{bot.user} has logged in!")
     
-    # Load server configurations
-    for guild in bot.guilds:
-        try:
-            # Store full config (emojis + settings)
-            server_configs[guild.id] = config_manager.load_config(guild.id)
-            logger.info(f"Loaded config for server: {guild.name} ({guild.id})")
-        except Exception as e:
-            logger.error(f"Error loading config for server {guild.id}: {e}", exc_info=True)
+    # Load server configurations concurrently, reading files off the event loop
+    await asyncio.gather(*(load_guild_config(guild) for guild in bot.guilds))
     
     try:
-        synced = await bot.tree.sync()
-        logger.info(f"Synced {len(synced)} command(s)")
+        # Only re-upload slash commands when they changed since the last sync
+        command_hash = get_command_tree_hash()
+        if command_hash == read_synced_command_hash():
+            logger.info("Commands unchanged since last sync, skipping sync")
+        else:
+            synced = await bot.tree.sync()
+            logger.info(f"Synced {len(synced)} command(s)")
+            write_synced_command_hash(command_hash)
     except Exception as e:
         logger.error(f"Failed to sync commands: {e}", exc_info=True)
 
@@ -84,8 +394,9 @@ async def on_ready():
 async def on_guild_join(guild: discord.Guild):
     """Called when the bot joins a new guild."""
     try:
-        # Load configuration for the new guild
-        server_configs[guild.id] = config_manager.load_config(guild.id)
+        # Load configuration for the new guild, reading the file off the event loop
+        server_configs[guild.id] = await asyncio.to_thread(config_manager.load_config, guild.id)
+        guild_resources[guild.id] = await asyncio.to_thread(build_guild_resources, guild.id)
         logger.info(f"Loaded config for new server: {guild.name} ({guild.id})")
     except Exception as e:
         logger.error(f"Error loading config for new server {guild.id}: {e}", exc_info=True)
@@ -97,69 +408,63 @@ async def on_message_delete(message: discord.Message):
     message_id = message.id
     if message_id in active_games:
         logger.info(f"Cleaning up game for deleted message {message_id}")
-        if message_id in active_games:
-            del active_games[message_id]
-        if message_id in game_players:
-            del game_players[message_id]
-        if message_id in game_owners:
-            del game_owners[message_id]
-        if message_id in previous_death_counts:
-            del previous_death_counts[message_id]
+        cleanup_game(message_id)
+
+
+@bot.event
+async def on_guild_emojis_update(guild: discord.Guild, before, after):
+    """Forget a server's emoji name index when its emojis change."""
+    guild_emoji_by_name.pop(guild.id, None)
 
 
-def create_game_embed(game: Game, title: str = "🎮 Game", emojis: dict = None, item_types: dict = None, user_id: Optional[int] = None, guild_id: Optional[int] = None) -> discord.Embed:
+def get_guild_emoji(guild: discord.Guild, name: str) -> Optional[discord.Emoji]:
+    """Find a server's custom emoji by name, indexing the server's emojis on first use."""
+    emojis_by_name = guild_emoji_by_name.get(guild.id)
+    if emojis_by_name is None:
+        # Reversed so the first emoji with a given name wins, as with a linear search
+        emojis_by_name = {emoji.name: emoji for emoji in reversed(guild.emojis)}
+        guild_emoji_by_name[guild.id] = emojis_by_name
+    return emojis_by_name.get(name)
+
+
+@functools.lru_cache(maxsize=256)
+def format_win_text(wins: int) -> str:
+    """Get the wins suffix shown after a player's progress (empty before the first win)."""
+    return f", {wins} win{'s' if wins != 1 else ''}" if wins > 0 else ""
+
+
+def create_game_embed(game: Game, title: str = "🎮 Game", resources: Optional[GuildResources] = None, user_id: Optional[int] = None, guild_id: Optional[int] = None) -> discord.Embed:
     """Create a game embed with field, inventory, and level info for all players."""
-    # Check if using custom emojis (they don't render in code blocks)
     field_render = game.render()
-    if emojis is None:
-        emojis = {}
-    if item_types is None:
-        item_types = {}
+    if resources is None:
+        resources = get_guild_resources(guild_id)
+    item_types = resources.item_types
     
-    # Get UI emojis (heart, skull, and join)
-    heart_emoji = emojis.get("heart", "❤️")
-    skull_emoji = emojis.get("skull", "💀")
-    join_emoji = emojis.get("join", "✅")
-    
-    all_emojis = list(emojis.values()) if emojis else []
-    all_emojis.extend(item_types.values() if item_types else [])
-    uses_custom_emoji = any(
-        emoji.startswith("<:") or emoji.startswith("<a:") 
-        for emoji in all_emojis
-    )
-    
-    # Use code block for Unicode emojis, plain text for custom emojis
-    if uses_custom_emoji:
-        description = field_render
-    else:
-        description = f"```\n{field_render}\n```"
+    # Get UI emojis (skull and join)
+    skull_emoji = resources.skull_emoji
+    join_emoji = resources.join_emoji
+    uses_custom_emoji = resources.uses_custom_emoji
     
     # Discord embed description limit is 4096 characters
-    # If the field is too large, truncate and add a warning
-    MAX_DESCRIPTION_LENGTH = 4096
-    if len(description) > MAX_DESCRIPTION_LENGTH:
-        # Calculate how much we can show (leave room for warning message)
-        warning_msg = "\n\n⚠️ Field too large to display fully. Consider reducing field size in settings."
-        max_field_length = MAX_DESCRIPTION_LENGTH - len(warning_msg)
-        
-        if uses_custom_emoji:
-            # Truncate the field render
-            truncated_field = field_render[:max_field_length]
-            description = truncated_field + warning_msg
-        else:
-            # For code blocks, we need to account for the ``` markers
-            code_block_overhead = 7  # ```\n and \n```
-            max_field_length = MAX_DESCRIPTION_LENGTH - len(warning_msg) - code_block_overhead
-            truncated_field = field_render[:max_field_length]
-            description = f"```\n{truncated_field}\n```{warning_msg}"
+    # Common case: the field fits, so wrap it (code block for Unicode emojis, plain text for custom emojis)
+    if len(field_render) <= resources.max_field_length:
+        description = resources.field_template.format(field_render)
+    elif uses_custom_emoji:
+        # Field too large: truncate and add a warning
+        truncated_field = field_render[:MAX_DESCRIPTION_LENGTH - len(FIELD_TOO_LARGE_WARNING)]
+        description = truncated_field + FIELD_TOO_LARGE_WARNING
+    else:
+        # For code blocks, we need to account for the ``` markers
+        truncated_field = field_render[:MAX_DESCRIPTION_LENGTH - len(FIELD_TOO_LARGE_WARNING) - CODE_BLOCK_OVERHEAD]
+        description = f"```\n{truncated_field}\n```{FIELD_TOO_LARGE_WARNING}"
     
     # Set embed color based on game state
     if game.game_over:
-        embed_color = discord.Color.red()
+        embed_color = GAME_OVER_COLOR
     elif game.is_level_complete():
-        embed_color = discord.Color.gold()
+        embed_color = LEVEL_COMPLETE_COLOR
     else:
-        embed_color = discord.Color.green()
+        embed_color = GAME_ACTIVE_COLOR
     
     embed = discord.Embed(
         title=title,
@@ -182,86 +487,83 @@ def create_game_embed(game: Game, title: str = "🎮 Game", emojis: dict = None,
         inline=True
     )
     
-    # Add players info
-    if game.player_positions:
-        players_text = ""
-        for player_id in game.players:
-            player_emoji = game.get_player_emoji(player_id)
+    # Build players, power-ups and inventories info in one pass over the players
+    show_players = bool(game.player_positions)
+    show_powerups = show_players and bool(guild_id)
+    players_lines = []
+    powerups_lines = []
+    inventories_lines = []
+    for player_id in game.players:
+        player_emoji = game.get_player_emoji(player_id)
+        
+        if show_players:
             lives = game.player_lives.get(player_id, 0)
-            lives_display = heart_emoji * lives if lives > 0 else skull_emoji
+            lives_display = resources.lives_display(lives)
             total_collected = game.get_total_collected(player_id)
             progress = f"{total_collected}/{game.required_items_count}"
             wins = game.get_player_wins(player_id)
-            win_text = f", {wins} win{'s' if wins != 1 else ''}" if wins > 0 else ""
+            win_text = format_win_text(wins)
             
             # Add XP and level info if guild_id is provided
             xp_text = ""
             if guild_id:
-                stats = score_manager.get_player_stats(guild_id, player_id)
-                xp = stats.get("xp", 0)
+                xp = score_manager.get_player_xp(guild_id, player_id)
                 level = score_manager.get_player_level(guild_id, player_id)
                 xp_text = f", Level {level} ({xp} XP)"
             
-            players_text += f"{player_emoji} Player: {lives_display} {lives} lives, {progress} items{win_text}{xp_text}\n"
-        
-        embed.add_field(
-            name="Players",
-            value=players_text.strip(),
-            inline=False
-        )
+            players_lines.append(f"{player_emoji} Player: {lives_display} {lives} lives, {progress} items{win_text}{xp_text}")
         
-        # Add power-ups info
-        if guild_id:
-            powerups_text = ""
-            for player_id in game.players:
-                player_emoji = game.get_player_emoji(player_id)
-                available_powerups = game.get_available_powerups(player_id)
-                active_powerups = game.get_active_powerups(player_id)
-                
-                powerup_info = []
-                if available_powerups:
-                    for powerup_type, count in available_powerups.items():
-                        powerup_emojis = {"shield": "🛡️", "extra_heart": "💚", "speed_boost": "⚡"}
-                        emoji = powerup_emojis.get(powerup_type, "❓")
-                        powerup_info.append(f"{emoji}x{count}")
-                
-                if active_powerups:
-                    active_info = []
-                    if active_powerups.get("shield"):
-                        active_info.append("🛡️")
-                    if active_powerups.get("speed_boost", 0) > 0:
-                        active_info.append(f"⚡({active_powerups['speed_boost']})")
-                    if active_info:
-                        powerup_info.append(f"[Active: {''.join(active_info)}]")
-                
-                if powerup_info:
-                    powerups_text += f"{player_emoji} {' '.join(powerup_info)}\n"
+        if show_powerups:
+            available_powerups = game.get_available_powerups(player_id)
+            active_powerups = game.get_active_powerups(player_id)
             
-            if powerups_text:
-                embed.add_field(
-                    name="Power-ups",
-                    value=powerups_text.strip(),
-                    inline=False
-                )
-    
-    # Add inventories for all players
-    inventories_text = ""
-    for player_id in game.players:
-        player_emoji = game.get_player_emoji(player_id)
+            powerup_info = []
+            if available_powerups:
+                for powerup_type, count in available_powerups.items():
+                    powerup_emojis = {"shield": "🛡️", "extra_heart": "💚", "speed_boost": "⚡"}
+                    emoji = powerup_emojis.get(powerup_type, UNKNOWN_EMOJI)
+                    powerup_info.append(f"{emoji}x{count}")
+            
+            if active_powerups:
+                active_info = []
+                if active_powerups.get("shield"):
+                    active_info.append("🛡️")
+                if active_powerups.get("speed_boost", 0) > 0:
+                    active_info.append(f"⚡({active_powerups['speed_boost']})")
+                if active_info:
+                    powerup_info.append(f"[Active: {''.join(active_info)}]")
+            
+            if powerup_info:
+                powerups_lines.append(f"{player_emoji} {' '.join(powerup_info)}")
+        
         inventory = game.get_inventory(player_id)
         if inventory:
             inv_items = []
             for item_type, count in inventory.items():
                 if count > 0:
-                    emoji = item_types.get(item_type, "❓") if item_types else "❓"
+                    emoji = item_types.get(item_type, UNKNOWN_EMOJI) if item_types else UNKNOWN_EMOJI
                     inv_items.append(f"{emoji} {item_type.capitalize()}: {count}")
             if inv_items:
-                inventories_text += f"{player_emoji} {' | '.join(inv_items)}\n"
+                inventories_lines.append(f"{player_emoji} {' | '.join(inv_items)}")
+    
+    if show_players:
+        embed.add_field(
+            name="Players",
+            value="\n".join(players_lines),
+            inline=False
+        )
+    
+    if powerups_lines:
+        embed.add_field(
+            name="Power-ups",
+            value="\n".join(powerups_lines),
+            inline=False
+        )
     
-    if inventories_text:
+    if inventories_lines:
         embed.add_field(
             name="Inventories",
-            value=inventories_text.strip(),
+            value="\n".join(inventories_lines),
             inline=False
         )
     else:
@@ -287,50 +589,27 @@ async def play_command(interaction: discord.Interaction):
         guild_id = interaction.guild.id if interaction.guild else None
         
         # If user already has an active game, end it first
-        for message_id, players in list(game_players.items()):
-            if user_id in players:
-                # Remove user from that game
-                players.discard(user_id)
-                # If no players left, clean up the game
-                if not players:
-                    if message_id in active_games:
-                        del active_games[message_id]
-                    if message_id in game_owners:
-                        del game_owners[message_id]
-                    del game_players[message_id]
+        for message_id in list(user_active_games.get(user_id, ())):
+            # Remove user from that game
+            remove_game_player(message_id, user_id)
+            # If no players left, clean up the game
+            if not game_players.get(message_id):
+                cleanup_game(message_id)
         
         # Reset level to 1 for new game
         user_levels[user_id] = 1
         
         # Get server-specific emojis and settings
-        if guild_id and guild_id in server_configs:
-            server_emojis = config_manager.get_emojis(guild_id)
-            item_types = config_manager.get_item_types(guild_id)
-            game_settings = config_manager.get_game_settings(guild_id)
-        else:
-            server_emojis = config_manager.get_default_emojis()
-            item_types = config_manager.get_default_item_types()
-            game_settings = config_manager.get_game_settings(0) if guild_id else config_manager.get_game_settings(0)
-        
-        # Create emoji dict for Game class
-        game_emojis = {
-            "wall": server_emojis["wall"],
-            "obstacle": server_emojis["obstacle"],
-            "empty": server_emojis["empty"],
-            "player": server_emojis["player"],
-            "portal": server_emojis["portal"],
-            "zombie": server_emojis["zombie"],
-        }
+        resources = get_guild_resources(guild_id)
+        server_emojis = resources.emojis
+        item_types = resources.item_types
         
         # Get player lives from server settings
-        player_lives = game_settings.get("player_lives", 3)
-        
-        # Get player emojis for this server
-        player_emojis = config_manager.get_player_emojis(guild_id) if guild_id else config_manager.get_player_emojis(0)
+        player_lives = resources.game_settings.get("player_lives", 3)
         
         # Create new game at level 1 with server-specific emojis and settings
         # Pass first_player_id to add the creator as the first player
-        game = Game(level=1, player_lives=player_lives, emojis=game_emojis, item_types=item_types, first_player_id=user_id, player_emojis=player_emojis)
+        game = Game(level=1, player_lives=player_lives, emojis=resources.game_emojis, item_types=item_types, first_player_id=user_id, player_emojis=resources.player_emojis)
         
         # Load power-ups from shop inventory
         if guild_id:
@@ -338,17 +617,17 @@ async def play_command(interaction: discord.Interaction):
             game.load_powerups(user_id, powerup_inventory)
         
         # Create embed
-        embed = create_game_embed(game, "🎮 Game Started!", emojis=server_emojis, item_types=item_types, guild_id=guild_id)
+        embed = create_game_embed(game, "🎮 Game Started!", resources=resources, guild_id=guild_id)
         
         # Send message
         await interaction.response.send_message(embed=embed)
         message = await interaction.original_response()
         
         # Add join reaction first, then movement reactions
-        join_emoji = server_emojis.get("join", "✅")
-        await message.add_reaction(join_emoji)
+        await message.add_reaction(resources.join_emoji)
         
         movement_emojis = [server_emojis["up"], server_emojis["down"], server_emojis["left"], server_emojis["right"]]
+        # One at a time, so the arrows always appear in the same order
         for emoji in movement_emojis:
             await message.add_reaction(emoji)
         
@@ -370,12 +649,9 @@ async def play_command(interaction: discord.Interaction):
         
         # Store game state
         active_games[message.id] = game
-        game_players[message.id] = {user_id}  # Creator is automatically joined
+        add_game_player(message.id, user_id)  # Creator is automatically joined
         game_owners[message.id] = user_id
         
-        # Initialize death tracking for this game
-        previous_death_counts[message.id] = {}
-        
         # Track game start
         if guild_id:
             score_manager.increment_player_score(guild_id, user_id, "games_played")
@@ -412,38 +688,26 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
         # Validate game still exists
         if game is None:
             # Clean up invalid game
-            if message_id in active_games:
-                del active_games[message_id]
-            if message_id in game_players:
-                del game_players[message_id]
-            if message_id in game_owners:
-                del game_owners[message_id]
+            cleanup_game(message_id)
             return
         
         # Get guild ID for server-specific emojis
         guild_id = reaction.message.guild.id if reaction.message.guild else None
     
         # Get server emojis
-        if guild_id and guild_id in server_configs:
-            server_emojis = config_manager.get_emojis(guild_id)
-            item_types = config_manager.get_item_types(guild_id)
-            emoji_to_direction = config_manager.get_emoji_to_direction(guild_id)
-        else:
-            server_emojis = config_manager.get_default_emojis()
-            item_types = config_manager.get_default_item_types()
-            emoji_to_direction = config_manager.get_emoji_to_direction(0)  # Use defaults
+        resources = get_guild_resources(guild_id)
+        direction_by_key = resources.direction_by_key
         
         # Get UI emojis
-        skull_emoji = server_emojis.get("skull", "💀")
-        join_emoji = server_emojis.get("join", "✅")
+        skull_emoji = resources.skull_emoji
         
         # Handle both Unicode and custom emojis
-        emoji_str = str(reaction.emoji)
+        reaction_key = emoji_key(reaction.emoji)
         
         # Check if this is a join reaction
-        if emoji_str == join_emoji:
+        if reaction_key == resources.join_key:
             # Check if user is already in the game
-            user_in_game = message_id in game_players and user.id in game_players[message_id]
+            user_in_game = user.id in game_players.get(message_id, ())
             
             if user_in_game:
                 # User already joined, remove reaction
@@ -462,8 +726,7 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
                 return
             
             # Get player lives from server settings
-            game_settings = config_manager.get_game_settings(guild_id) if guild_id else config_manager.get_game_settings(0)
-            player_lives = game_settings.get("player_lives", 3)
+            player_lives = resources.game_settings.get("player_lives", 3)
             
             # Add player to game
             if game.add_player(user.id, player_lives):
@@ -473,20 +736,19 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
                     game.load_powerups(user.id, powerup_inventory)
                 
                 # Add to game_players tracking
-                if message_id not in game_players:
-                    game_players[message_id] = set()
-                game_players[message_id].add(user.id)
+                add_game_player(message_id, user.id)
                 
                 # Get player emoji
                 player_emoji = game.get_player_emoji(user.id)
                 
                 # Create join message embed
-                embed = create_game_embed(game, "🎮 Game", emojis=server_emojis, item_types=item_types, guild_id=guild_id)
+                embed = create_game_embed(game, "🎮 Game", resources=resources, guild_id=guild_id)
                 embed.add_field(
                     name="Player Joined",
                     value=f"{player_emoji} {user.display_name} joined the game!",
                     inline=False
                 )
+                cancel_game_edit(message_id)
                 await reaction.message.edit(embed=embed)
                 
                 # Add power-up reactions if player has any available
@@ -515,17 +777,17 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
         
         # Check if this is a power-up activation reaction
         powerup_emojis = {
-            "🛡️": "shield",
-            "💚": "extra_heart",
-            "⚡": "speed_boost"
+            ("🛡️", None): "shield",
+            ("💚", None): "extra_heart",
+            ("⚡", None): "speed_boost"
         }
         
-        if emoji_str in powerup_emojis:
+        if reaction_key in powerup_emojis:
             # User is trying to activate a power-up
-            powerup_type = powerup_emojis[emoji_str]
+            powerup_type = powerup_emojis[reaction_key]
             
             # Check if user is in the game
-            user_in_game = message_id in game_players and user.id in game_players[message_id]
+            user_in_game = user.id in game_players.get(message_id, ())
             
             if not user_in_game:
                 try:
@@ -550,7 +812,7 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
                     shop_manager.use_item(guild_id, user.id, powerup_type)
                 
                 # Update embed
-                embed = create_game_embed(game, "🎮 Game", emojis=server_emojis, item_types=item_types, guild_id=guild_id)
+                embed = create_game_embed(game, "🎮 Game", resources=resources, guild_id=guild_id)
                 powerup_names = {
                     "shield": "Shield",
                     "extra_heart": "Extra Heart",
@@ -561,6 +823,7 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
                     value=f"{user.display_name} used {powerup_names.get(powerup_type, powerup_type)}!",
                     inline=False
                 )
+                cancel_game_edit(message_id)
                 await reaction.message.edit(embed=embed)
             else:
                 # Power-up not available
@@ -571,11 +834,11 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
             return
         
         # Check if this is a movement reaction
-        if emoji_str not in emoji_to_direction:
+        if reaction_key not in direction_by_key:
             return  # Not a movement emoji, ignore
         
         # Check if user is in the game (must join first)
-        user_in_game = message_id in game_players and user.id in game_players[message_id]
+        user_in_game = user.id in game_players.get(message_id, ())
         
         if not user_in_game:
             # User hasn't joined yet, remove reaction and ignore
@@ -588,7 +851,8 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
         # Check if game is over
         if game.game_over:
             # Show game over embed
-            embed = create_game_embed(game, f"{skull_emoji} Game Over", emojis=server_emojis, item_types=item_types, guild_id=guild_id)
+            embed = create_game_embed(game, f"{skull_emoji} Game Over", resources=resources, guild_id=guild_id)
+            cancel_game_edit(message_id)
             await reaction.message.edit(embed=embed)
             # Remove user's reaction
             try:
@@ -597,7 +861,7 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
                 pass
             return
         
-        direction = emoji_to_direction[emoji_str]
+        direction = direction_by_key[reaction_key]
         
         # Track items collected before move
         items_before = game.get_total_collected(user.id) if user.id in game.player_positions else 0
@@ -629,26 +893,10 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
                         # Award achievement XP
                         score_manager.award_xp(guild_id, user.id, xp_reward)
         
-        # Track deaths - check if any players died
+        # Track deaths - the game reports which players died during this move
         if guild_id:
-            # Initialize previous death counts for this game if not exists
-            if message_id not in previous_death_counts:
-                previous_death_counts[message_id] = {}
-            
-            # Check all players who were in the game (including those who might have been removed)
-            # We check game_players to include all players who joined, not just active ones
-            all_player_ids = set(game_players.get(message_id, set()))
-            all_player_ids.update(game.players)  # Also include current players
-            
-            for player_id in all_player_ids:
-                current_deaths = game.get_player_deaths(player_id)
-                previous_deaths = previous_death_counts[message_id].get(player_id, 0)
-                
-                if current_deaths > previous_deaths:
-                    # Player died - track it
-                    deaths_to_add = current_deaths - previous_deaths
-                    score_manager.increment_player_score(guild_id, player_id, "deaths", deaths_to_add)
-                    previous_death_counts[message_id][player_id] = current_deaths
+            for player_id in game.get_last_move_deaths():
+                score_manager.increment_player_score(guild_id, player_id, "deaths")
         
         # Check if level completed (player won)
         if game.is_level_complete() and game.winner is not None:
@@ -682,8 +930,7 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
             # Winner announcement
             winner_user_id = game.winner
             try:
-                winner_user = await bot.fetch_user(winner_user_id)
-                winner_name = winner_user.display_name
+                winner_name = await get_display_name(winner_user_id)
             except:
                 winner_name = f"User {winner_user_id}"
             
@@ -691,8 +938,8 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
             winner_wins = game.get_player_wins(winner_user_id)
             
             # Show completion message
-            embed = create_game_embed(game, f"🎉 Level {game.level} Complete!", emojis=server_emojis, item_types=item_types, guild_id=guild_id)
-            embed.color = discord.Color.gold()
+            embed = create_game_embed(game, f"🎉 Level {game.level} Complete!", resources=resources, guild_id=guild_id)
+            embed.color = LEVEL_COMPLETE_COLOR
             embed.add_field(
                 name="Winner",
                 value=f"{winner_emoji} **{winner_name}** won Level {game.level}! (Total wins: {winner_wins})",
@@ -703,6 +950,7 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
                 value=f"Advancing to Level {game.level + 1}...",
                 inline=False
             )
+            cancel_game_edit(message_id)
             await reaction.message.edit(embed=embed)
             
             # Wait a moment before advancing
@@ -719,12 +967,9 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
             
             active_games[message_id] = new_game
             
-            # Preserve previous death counts for the new game
-            if message_id in previous_death_counts:
-                previous_death_counts[message_id] = {pid: game.get_player_deaths(pid) for pid in game.players}
-            
             # Update embed for new level
-            new_embed = create_game_embed(new_game, f"🎮 Level {new_game.level}", emojis=server_emojis, item_types=item_types, guild_id=guild_id)
+            new_embed = create_game_embed(new_game, f"🎮 Level {new_game.level}", resources=resources, guild_id=guild_id)
+            cancel_game_edit(message_id)
             await reaction.message.edit(embed=new_embed)
             
             # Remove user's reaction
@@ -738,14 +983,11 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
         if game.game_over:
             # Track game completion for all players
             if guild_id:
-                for player_id in list(game_players.get(message_id, set())):
+                for player_id in game_players.get(message_id, ()):
                     score_manager.increment_player_score(guild_id, player_id, "games_completed")
             
-            # Clean up death tracking for this game
-            if message_id in previous_death_counts:
-                del previous_death_counts[message_id]
-            
-            embed = create_game_embed(game, f"{skull_emoji} Game Over", emojis=server_emojis, item_types=item_types, guild_id=guild_id)
+            embed = create_game_embed(game, f"{skull_emoji} Game Over", resources=resources, guild_id=guild_id)
+            cancel_game_edit(message_id)
             await reaction.message.edit(embed=embed)
             # Remove user's reaction
             try:
@@ -754,9 +996,10 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
                 pass
             return
         
-        # Update embed with current game state
-        embed = create_game_embed(game, "🎮 Game", emojis=server_emojis, item_types=item_types, guild_id=guild_id)
-        await reaction.message.edit(embed=embed)
+        # Update embed with current game state (a blocked move changes nothing, so skip the edit)
+        # Rapid moves are coalesced into one edit to stay under Discord's edit rate limit
+        if moved:
+            schedule_game_edit(reaction.message, resources, guild_id)
         
         # Remove user's reaction to allow repeated moves
         try:
@@ -772,12 +1015,7 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
             message_id = reaction.message.id if hasattr(reaction, 'message') and reaction.message else None
             if message_id:
                 logger.info(f"Game message {message_id} was deleted, cleaning up game")
-                if message_id in active_games:
-                    del active_games[message_id]
-                if message_id in game_players:
-                    del game_players[message_id]
-                if message_id in game_owners:
-                    del game_owners[message_id]
+                cleanup_game(message_id)
         except Exception as cleanup_error:
             logger.error(f"Error during cleanup: {cleanup_error}", exc_info=True)
     except discord.errors.Forbidden:
@@ -801,9 +1039,122 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
 
 
 # Configuration UI Components
+
+# Display labels for configurable emoji keys (built once instead of per click)
+EMOJI_LABELS = {
+    "wall": "Wall",
+    "obstacle": "Obstacle",
+    "empty": "Empty",
+    "player": "Player",
+    "portal": "Portal",
+    "zombie": "Zombie",
+    "heart": "Heart",
+    "skull": "Skull",
+    "diamond": "Diamond",
+    "wood": "Wood",
+    "stone": "Stone",
+    "coal": "Coal",
+    "player1": "Player 1",
+    "player2": "Player 2",
+    "player3": "Player 3",
+    "player4": "Player 4",
+    "join": "Join",
+    "up": "Up",
+    "down": "Down",
+    "left": "Left",
+    "right": "Right",
+}
+
+# Emoji keys per configuration category as (key, button row), in display order
+EMOJI_CATEGORY_KEYS = {
+    "field_objects": (
+        ("wall", 0), ("obstacle", 0), ("empty", 0),
+        ("player", 1), ("portal", 1), ("zombie", 1),
+        ("heart", 2), ("skull", 2),
+    ),
+    "items": (
+        ("diamond", 0), ("wood", 0),
+        ("stone", 1), ("coal", 1),
+    ),
+    "player_emojis": (
+        ("player1", 0), ("player2", 0),
+        ("player3", 1), ("player4", 1),
+    ),
+    "movement": (
+        ("join", 0), ("up", 0),
+        ("down", 1), ("left", 1),
+        ("right", 2),
+    ),
+}
+
+# Emoji categories listed by "View All" as (field name, category), in display order
+VIEW_ALL_EMOJI_GROUPS = (
+    ("Field Objects & UI", "field_objects"),
+    ("Items", "items"),
+    ("Player Emojis", "player_emojis"),
+    ("Movement & Join", "movement"),
+)
+
+# Category buttons shown by /configure as (category, label, style, row)
+CATEGORY_BUTTONS = (
+    ("field_objects", "Field Objects", discord.ButtonStyle.secondary, 0),
+    ("items", "Items", discord.ButtonStyle.secondary, 0),
+    ("player_emojis", "Player Emojis", discord.ButtonStyle.secondary, 0),
+    ("movement", "Movement", discord.ButtonStyle.secondary, 0),
+    ("game_settings", "Game Settings", discord.ButtonStyle.secondary, 1),
+    ("view_all", "View All", discord.ButtonStyle.success, 1),
+)
+
+# Category overview shown by /configure
+CONFIGURE_CATEGORIES_TEXT = (
+    "• **Field Objects**: Wall, Obstacle, Empty, Player, Portal, Zombie, Heart, Skull\n"
+    "• **Items**: Diamond, Wood, Stone, Coal\n"
+    "• **Player Emojis**: Player 1, Player 2, Player 3, Player 4\n"
+    "• **Movement**: Join, Up, Down, Left, Right\n"
+    "• **Game Settings**: Player Lives"
+)
+
+# Static parts of each category's configuration embed; fields are filled in per click
+EMOJI_CATEGORY_EMBEDS = {
+    "field_objects": {
+        "title": "Configure Field Object & UI Emojis",
+        "description": "Click a button to set the emoji for that object.",
+        "color": discord.Color.blue().value,
+    },
+    "items": {
+        "title": "Configure Item Emojis",
+        "description": "Click a button to set the emoji for that item.",
+        "color": discord.Color.green().value,
+    },
+    "player_emojis": {
+        "title": "Configure Player Emojis",
+        "description": "Click a button to set the emoji for that player position. These emojis are assigned to players 1-4 based on join order.",
+        "color": discord.Color.purple().value,
+    },
+    "movement": {
+        "title": "Configure Movement & Join Emojis",
+        "description": "Click a button to set the emoji for that action.",
+        "color": discord.Color.orange().value,
+    },
+}
+
+
+# Emoji formats accepted by the emoji modal
+CUSTOM_EMOJI_RE = re.compile(r"<a?:\w{2,32}:\d{17,20}>")
+# Unicode emoji: a keycap, or pictographs joined by ZWJ / variation selectors / skin tones / tag
+# characters, capped at 10 code points like the previous length check
+_EMOJI_PICTOGRAPH = "\u00a9\u00ae\u203c-\u2bff\u3030\u303d\u3297\u3299\U0001F000-\U0001FAFF"
+UNICODE_EMOJI_RE = re.compile(
+    "[#*0-9]\ufe0f?\u20e3"
+    f"|(?=.{{1,10}}$)[{_EMOJI_PICTOGRAPH}][{_EMOJI_PICTOGRAPH}\ufe0f\u200d\U000E0020-\U000E007F]*"
+)
+
+
 class SettingInputModal(discord.ui.Modal):
     """Modal for inputting numeric setting values."""
     
+    __slots__ = ("setting_key", "setting_name", "current_value", "config_manager", "guild_id", "min_value", "max_value")
+    
     def __init__(self, setting_key: str, setting_name: str, current_value: int, config_manager: ConfigManager, guild_id: int, min_value: int = 1, max_value: int = 100):
         super().__init__(title=f"Set {setting_name}")
         self.setting_key = setting_key
@@ -834,13 +1185,14 @@ class SettingInputModal(discord.ui.Modal):
                 )
                 return
             
-            # Update configuration
-            success = self.config_manager.update_setting(self.guild_id, self.setting_key, value)
+            # Update configuration (write the config file off the event loop)
+            success = await asyncio.to_thread(self.config_manager.update_setting, self.guild_id, self.setting_key, value)
             
             if success:
                 # Update in-memory config if it exists
                 if self.guild_id in server_configs:
                     server_configs[self.guild_id][self.setting_key] = value
+                guild_resources.pop(self.guild_id, None)
                 
                 await interaction.response.send_message(
                     f"✅ Updated **{self.setting_name}** to: {value}",
@@ -861,6 +1213,8 @@ class SettingInputModal(discord.ui.Modal):
 class EmojiInputModal(discord.ui.Modal, title="Set Emoji"):
     """Modal for inputting emoji value."""
     
+    __slots__ = ("emoji_key", "emoji_name", "current_value", "config_manager", "guild_id")
+    
     def __init__(self, emoji_key: str, emoji_name: str, current_value: str, config_manager: ConfigManager, guild_id: int):
         super().__init__()
         self.emoji_key = emoji_key
@@ -888,7 +1242,7 @@ class EmojiInputModal(discord.ui.Modal, title="Set Emoji"):
             # Try to find the emoji in the guild
             if interaction.guild:
                 # Search for custom emoji by name
-                custom_emoji = utils.get(interaction.guild.emojis, name=emoji_name)
+                custom_emoji = get_guild_emoji(interaction.guild, emoji_name)
                 if custom_emoji:
                     # Convert to proper format
                     if custom_emoji.animated:
@@ -915,12 +1269,8 @@ class EmojiInputModal(discord.ui.Modal, title="Set Emoji"):
                 )
                 return
         
-        # Basic validation - check if it looks like a valid emoji or custom emoji
-        # Custom emoji format: <:name:id> or <a:name:id>
-        # Unicode emojis can be 1-10 characters (including modifiers)
-        is_custom = (emoji_value.startswith("<:") or emoji_value.startswith("<a:")) and emoji_value.endswith(">")
-        is_unicode = len(emoji_value) > 0 and len(emoji_value) <= 10  # Allow longer unicode sequences
-        is_valid = is_custom or is_unicode
+        # Validate as a custom emoji (<:name:id> or <a:name:id>) or a Unicode emoji sequence
+        is_valid = bool(CUSTOM_EMOJI_RE.fullmatch(emoji_value) or UNICODE_EMOJI_RE.fullmatch(emoji_value))
         
         if not is_valid:
             await interaction.response.send_message(
@@ -933,8 +1283,16 @@ class EmojiInputModal(discord.ui.Modal, title="Set Emoji"):
             )
             return
         
-        # Update configuration
-        success = self.config_manager.update_emoji(self.guild_id, self.emoji_key, emoji_value)
+        # Nothing to save if the emoji is unchanged
+        if server_configs.get(self.guild_id, {}).get(self.emoji_key) == emoji_value:
+            await interaction.response.send_message(
+                f"ℹ️ **{self.emoji_name}** emoji is already set to: {emoji_value}",
+                ephemeral=True
+            )
+            return
+        
+        # Update configuration (write the config file off the event loop)
+        success = await asyncio.to_thread(self.config_manager.update_emoji, self.guild_id, self.emoji_key, emoji_value)
         
         if success:
             # Update in-memory config
@@ -942,6 +1300,7 @@ class EmojiInputModal(discord.ui.Modal, title="Set Emoji"):
                 server_configs[self.guild_id][self.emoji_key] = emoji_value
             else:
                 server_configs[self.guild_id] = self.config_manager.get_emojis(self.guild_id)
+            guild_resources.pop(self.guild_id, None)
             
             # Show original input if it was converted
             display_value = original_value if original_value != emoji_value else emoji_value
@@ -956,29 +1315,89 @@ class EmojiInputModal(discord.ui.Modal, title="Set Emoji"):
             )
 
 
-def create_emoji_button(emoji_key: str, emoji_name: str, current_value: str, config_manager: ConfigManager, guild_id: int, row: int = None):
-    """Helper function to create a button for setting an emoji."""
-    # Truncate long emoji values for button label
-    display_value = current_value[:20] if len(current_value) > 20 else current_value
+class EmojiConfigView(discord.ui.View):
+    """Persistent view with emoji buttons, dispatched by custom_id so it also works after restarts."""
     
-    # Create a closure to capture the values properly
-    def make_callback(key, name):
-        async def button_callback(interaction: discord.Interaction):
-            # Reload emojis to get latest values
-            current_emojis = config_manager.get_emojis(guild_id)
-            current = current_emojis.get(key, "❓")
-            modal = EmojiInputModal(key, name, current, config_manager, guild_id)
-            modal.emoji_input.default = current
-            await interaction.response.send_modal(modal)
-        return button_callback
+    BUTTON_ID_PREFIX = "configure_emoji:"
     
-    button = discord.ui.Button(
-        label=f"{emoji_name}: {display_value}",
-        style=discord.ButtonStyle.primary,
-        row=row
+    def __init__(self):
+        super().__init__(timeout=None)
+    
+    def add_emoji_button(self, emoji_key: str, label: str, row: Optional[int] = None):
+        """Add a button that opens the emoji modal for one key."""
+        button = discord.ui.Button(
+            label=label,
+            style=discord.ButtonStyle.primary,
+            row=row,
+            custom_id=f"{self.BUTTON_ID_PREFIX}{emoji_key}"
+        )
+        button.callback = functools.partial(self.on_emoji_button, emoji_key)
+        self.add_item(button)
+    
+    async def on_emoji_button(self, emoji_key: str, interaction: discord.Interaction):
+        """Open the emoji modal with the server's current value for the clicked key."""
+        if not interaction.guild_id:
+            await interaction.response.send_message(GUILD_ONLY_MESSAGE, ephemeral=True)
+            return
+        # Persistent buttons outlive the /configure permission check
+        if not interaction.permissions.administrator:
+            await interaction.response.send_message(ADMIN_REQUIRED_MESSAGE, ephemeral=True)
+            return
+        
+        # The in-memory config is kept current by the modals, so this is a dict lookup
+        config = server_configs.get(interaction.guild_id)
+        if config is None:
+            config = config_manager.get_emojis(interaction.guild_id)
+        current = config.get(emoji_key, UNKNOWN_EMOJI)
+        modal = EmojiInputModal(emoji_key, EMOJI_LABELS[emoji_key], current, config_manager, interaction.guild_id)
+        modal.emoji_input.default = current
+        await interaction.response.send_modal(modal)
+
+
+def build_emoji_category(category: str, current_emojis: dict) -> tuple[discord.ui.View, discord.Embed]:
+    """Helper function to create a category's emoji buttons and embed fields in one pass over its keys."""
+    view = EmojiConfigView()
+    lines = []
+    for key, row in EMOJI_CATEGORY_KEYS[category]:
+        label = EMOJI_LABELS[key]
+        current = current_emojis.get(key, UNKNOWN_EMOJI)
+        # Truncate long emoji values for button label
+        view.add_emoji_button(key, f"{label}: {current[:20]}", row)
+        lines.append(f"**{label}**: {current}")
+    # A finished view is sent without being stored, so clicks go to the persistent view
+    # from setup_hook instead of replacing its buttons (and expiring them with this reply)
+    view.stop()
+    data = dict(EMOJI_CATEGORY_EMBEDS[category])
+    # All current values in one field keeps the payload small
+    data["fields"] = [{"name": "Current", "value": "\n".join(lines), "inline": False}]
+    return view, discord.Embed.from_dict(data)
+
+
+def create_view_all_embed(snapshot: ConfigSnapshot) -> discord.Embed:
+    """Create the embed listing every configured emoji and setting for a server."""
+    current_emojis = snapshot.emojis
+    current_settings = snapshot.settings
+    
+    embed = discord.Embed(
+        title="Current Configuration",
+        description="All configured settings for this server:",
+        color=discord.Color.purple()
     )
-    button.callback = make_callback(emoji_key, emoji_name)
-    return button
+    
+    # One field per emoji category (missing emojis show as unknown)
+    emojis = defaultdict(lambda: UNKNOWN_EMOJI, current_emojis)
+    for field_name, category in VIEW_ALL_EMOJI_GROUPS:
+        embed.add_field(
+            name=field_name,
+            value="\n".join(f"**{EMOJI_LABELS[key]}**: {emojis[key]}" for key, _ in EMOJI_CATEGORY_KEYS[category]),
+            inline=False
+        )
+    
+    # Game Settings
+    settings_text = f"**Player Lives**: {current_settings.get('player_lives', 3)}"
+    embed.add_field(name="Game Settings", value=settings_text, inline=False)
+    
+    return embed
 
 
 def create_setting_button(setting_key: str, setting_name: str, current_value: int, config_manager: ConfigManager, guild_id: int, min_value: int = 1, max_value: int = 100, row: int = None):
@@ -1005,111 +1424,38 @@ def create_setting_button(setting_key: str, setting_name: str, current_value: in
 class CategoryView(discord.ui.View):
     """View with buttons for emoji categories."""
     
+    __slots__ = ("config_manager", "guild_id", "emojis")
+    
     def __init__(self, config_manager: ConfigManager, guild_id: int, emojis: dict):
         super().__init__(timeout=300)  # 5 minute timeout
         self.config_manager = config_manager
         self.guild_id = guild_id
         self.emojis = emojis
-    
-    @discord.ui.button(label="Field Objects", style=discord.ButtonStyle.secondary, row=0)
-    async def field_objects_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        """Show field object emoji configuration."""
-        # Reload emojis to get latest values
-        current_emojis = self.config_manager.get_emojis(self.guild_id)
-        view = discord.ui.View(timeout=300)  # Plain view, no category buttons
-        
-        view.add_item(create_emoji_button("wall", "Wall", current_emojis.get("wall", "❓"), self.config_manager, self.guild_id, 0))
-        view.add_item(create_emoji_button("obstacle", "Obstacle", current_emojis.get("obstacle", "❓"), self.config_manager, self.guild_id, 0))
-        view.add_item(create_emoji_button("empty", "Empty", current_emojis.get("empty", "❓"), self.config_manager, self.guild_id, 0))
-        view.add_item(create_emoji_button("player", "Player", current_emojis.get("player", "❓"), self.config_manager, self.guild_id, 1))
-        view.add_item(create_emoji_button("portal", "Portal", current_emojis.get("portal", "❓"), self.config_manager, self.guild_id, 1))
-        view.add_item(create_emoji_button("zombie", "Zombie", current_emojis.get("zombie", "❓"), self.config_manager, self.guild_id, 1))
-        view.add_item(create_emoji_button("heart", "Heart", current_emojis.get("heart", "❓"), self.config_manager, self.guild_id, 2))
-        view.add_item(create_emoji_button("skull", "Skull", current_emojis.get("skull", "❓"), self.config_manager, self.guild_id, 2))
-        
-        embed = discord.Embed(
-            title="Configure Field Object & UI Emojis",
-            description="Click a button to set the emoji for that object.",
-            color=discord.Color.blue()
-        )
-        for key in ["wall", "obstacle", "empty", "player", "portal", "zombie", "heart", "skull"]:
-            current = current_emojis.get(key, "❓")
-            embed.add_field(name=key.capitalize(), value=f"Current: {current}", inline=True)
         
-        await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+        # Add one button per category from the static descriptor table
+        for category, label, style, row in CATEGORY_BUTTONS:
+            button = discord.ui.Button(label=label, style=style, row=row)
+            button.callback = functools.partial(self.on_category, category)
+            self.add_item(button)
     
-    @discord.ui.button(label="Items", style=discord.ButtonStyle.secondary, row=0)
-    async def items_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        """Show item emoji configuration."""
-        # Reload emojis to get latest values
-        current_emojis = self.config_manager.get_emojis(self.guild_id)
-        view = discord.ui.View(timeout=300)  # Plain view, no category buttons
-        
-        view.add_item(create_emoji_button("diamond", "Diamond", current_emojis.get("diamond", "❓"), self.config_manager, self.guild_id, 0))
-        view.add_item(create_emoji_button("wood", "Wood", current_emojis.get("wood", "❓"), self.config_manager, self.guild_id, 0))
-        view.add_item(create_emoji_button("stone", "Stone", current_emojis.get("stone", "❓"), self.config_manager, self.guild_id, 1))
-        view.add_item(create_emoji_button("coal", "Coal", current_emojis.get("coal", "❓"), self.config_manager, self.guild_id, 1))
-        
-        embed = discord.Embed(
-            title="Configure Item Emojis",
-            description="Click a button to set the emoji for that item.",
-            color=discord.Color.green()
-        )
-        for key in ["diamond", "wood", "stone", "coal"]:
-            current = current_emojis.get(key, "❓")
-            embed.add_field(name=key.capitalize(), value=f"Current: {current}", inline=True)
-        
-        await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+    async def on_category(self, category: str, interaction: discord.Interaction):
+        """Show the configuration screen for the clicked category."""
+        if category == "game_settings":
+            await self.send_game_settings(interaction)
+        elif category == "view_all":
+            await self.send_view_all(interaction)
+        else:
+            await self.send_emoji_category(interaction, category)
     
-    @discord.ui.button(label="Player Emojis", style=discord.ButtonStyle.secondary, row=0)
-    async def player_emojis_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        """Show player emoji configuration."""
+    async def send_emoji_category(self, interaction: discord.Interaction, category: str):
+        """Show emoji configuration for one category."""
         # Reload emojis to get latest values
         current_emojis = self.config_manager.get_emojis(self.guild_id)
-        view = discord.ui.View(timeout=300)  # Plain view, no category buttons
-        
-        view.add_item(create_emoji_button("player1", "Player 1", current_emojis.get("player1", "❓"), self.config_manager, self.guild_id, 0))
-        view.add_item(create_emoji_button("player2", "Player 2", current_emojis.get("player2", "❓"), self.config_manager, self.guild_id, 0))
-        view.add_item(create_emoji_button("player3", "Player 3", current_emojis.get("player3", "❓"), self.config_manager, self.guild_id, 1))
-        view.add_item(create_emoji_button("player4", "Player 4", current_emojis.get("player4", "❓"), self.config_manager, self.guild_id, 1))
-        
-        embed = discord.Embed(
-            title="Configure Player Emojis",
-            description="Click a button to set the emoji for that player position. These emojis are assigned to players 1-4 based on join order.",
-            color=discord.Color.purple()
-        )
-        for key in ["player1", "player2", "player3", "player4"]:
-            current = current_emojis.get(key, "❓")
-            embed.add_field(name=key.capitalize().replace("player", "Player "), value=f"Current: {current}", inline=True)
+        view, embed = build_emoji_category(category, current_emojis)
         
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
     
-    @discord.ui.button(label="Movement", style=discord.ButtonStyle.secondary, row=0)
-    async def movement_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        """Show movement emoji configuration."""
-        # Reload emojis to get latest values
-        current_emojis = self.config_manager.get_emojis(self.guild_id)
-        view = discord.ui.View(timeout=300)  # Plain view, no category buttons
-        
-        view.add_item(create_emoji_button("join", "Join", current_emojis.get("join", "❓"), self.config_manager, self.guild_id, 0))
-        view.add_item(create_emoji_button("up", "Up", current_emojis.get("up", "❓"), self.config_manager, self.guild_id, 0))
-        view.add_item(create_emoji_button("down", "Down", current_emojis.get("down", "❓"), self.config_manager, self.guild_id, 1))
-        view.add_item(create_emoji_button("left", "Left", current_emojis.get("left", "❓"), self.config_manager, self.guild_id, 1))
-        view.add_item(create_emoji_button("right", "Right", current_emojis.get("right", "❓"), self.config_manager, self.guild_id, 2))
-        
-        embed = discord.Embed(
-            title="Configure Movement & Join Emojis",
-            description="Click a button to set the emoji for that action.",
-            color=discord.Color.orange()
-        )
-        for key in ["join", "up", "down", "left", "right"]:
-            current = current_emojis.get(key, "❓")
-            embed.add_field(name=key.capitalize(), value=f"Current: {current}", inline=True)
-        
-        await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
-    
-    @discord.ui.button(label="Game Settings", style=discord.ButtonStyle.secondary, row=1)
-    async def game_settings_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def send_game_settings(self, interaction: discord.Interaction):
         """Show game settings configuration."""
         # Reload settings to get latest values
         current_settings = self.config_manager.get_game_settings(self.guild_id)
@@ -1127,50 +1473,16 @@ class CategoryView(discord.ui.View):
         
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
     
-    @discord.ui.button(label="View All", style=discord.ButtonStyle.success, row=1)
-    async def view_all_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def send_view_all(self, interaction: discord.Interaction):
         """Show all current configurations."""
-        # Reload emojis and settings to get latest values
-        current_emojis = self.config_manager.get_emojis(self.guild_id)
-        current_settings = self.config_manager.get_game_settings(self.guild_id)
-        
-        embed = discord.Embed(
-            title="Current Configuration",
-            description="All configured settings for this server:",
-            color=discord.Color.purple()
-        )
-        
-        # Field objects
-        field_text = "\n".join([
-            f"**{key.capitalize()}**: {current_emojis.get(key, '❓')}"
-            for key in ["wall", "obstacle", "empty", "player", "portal", "zombie", "heart", "skull"]
-        ])
-        embed.add_field(name="Field Objects & UI", value=field_text, inline=False)
-        
-        # Items
-        items_text = "\n".join([
-            f"**{key.capitalize()}**: {current_emojis.get(key, '❓')}"
-            for key in ["diamond", "wood", "stone", "coal"]
-        ])
-        embed.add_field(name="Items", value=items_text, inline=False)
-        
-        # Player Emojis
-        player_text = "\n".join([
-            f"**{key.capitalize().replace('player', 'Player ')}**: {current_emojis.get(key, '❓')}"
-            for key in ["player1", "player2", "player3", "player4"]
-        ])
-        embed.add_field(name="Player Emojis", value=player_text, inline=False)
-        
-        # Movement
-        movement_text = "\n".join([
-            f"**{key.capitalize()}**: {current_emojis.get(key, '❓')}"
-            for key in ["join", "up", "down", "left", "right"]
-        ])
-        embed.add_field(name="Movement & Join", value=movement_text, inline=False)
-        
-        # Game Settings
-        settings_text = f"**Player Lives**: {current_settings.get('player_lives', 3)}"
-        embed.add_field(name="Game Settings", value=settings_text, inline=False)
+        # Reuse the rendered embed until this server's configuration changes
+        config_version = self.config_manager.get_config_version(self.guild_id)
+        cached = view_all_embeds.get(self.guild_id)
+        if cached is not None and cached[0] == config_version:
+            embed = cached[1]
+        else:
+            embed = create_view_all_embed(self.config_manager.get_snapshot(self.guild_id))
+            view_all_embeds[self.guild_id] = (config_version, embed)
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -1181,7 +1493,7 @@ async def configure_command(interaction: discord.Interaction):
     # Check if user is administrator
     if not interaction.user.guild_permissions.administrator:
         await interaction.response.send_message(
-            "❌ You need administrator permissions to use this command.",
+            ADMIN_REQUIRED_MESSAGE,
             ephemeral=True
         )
         return
@@ -1189,17 +1501,15 @@ async def configure_command(interaction: discord.Interaction):
     guild_id = interaction.guild.id if interaction.guild else None
     if not guild_id:
         await interaction.response.send_message(
-            "❌ This command can only be used in a server.",
+            GUILD_ONLY_MESSAGE,
             ephemeral=True
         )
         return
     
-    # Get current emojis for this server
-    if guild_id in server_configs:
-        emojis = config_manager.get_emojis(guild_id)
-    else:
-        emojis = config_manager.get_emojis(guild_id)
-        server_configs[guild_id] = config_manager.load_config(guild_id)
+    # Configs are preloaded in on_ready; only servers joined since need loading here
+    if guild_id not in server_configs:
+        server_configs[guild_id] = await asyncio.to_thread(config_manager.load_config, guild_id)
+    emojis = config_manager.get_emojis(guild_id)
     
     # Create embed
     embed = discord.Embed(
@@ -1209,11 +1519,7 @@ async def configure_command(interaction: discord.Interaction):
     )
     embed.add_field(
         name="Categories",
-        value="• **Field Objects**: Wall, Obstacle, Empty, Player, Portal, Zombie, Heart, Skull\n"
-              "• **Items**: Diamond, Wood, Stone, Coal\n"
-              "• **Player Emojis**: Player 1, Player 2, Player 3, Player 4\n"
-              "• **Movement**: Join, Up, Down, Left, Right\n"
-              "• **Game Settings**: Player Lives",
+        value=CONFIGURE_CATEGORIES_TEXT,
         inline=False
     )
     embed.set_footer(text="Changes are saved automatically and persist across bot restarts.")
@@ -1225,10 +1531,23 @@ async def configure_command(interaction: discord.Interaction):
 
 
 # Leaderboard UI Components
+# Divider between the top 10 and the current player's row on the leaderboard
+LEADERBOARD_SEPARATOR = "\n" + "─" * 30 + "\n"
+
+
+def get_member_mention(guild: Optional[discord.Guild], user_id: int) -> str:
+    """Get a mention for a leaderboard row, from the guild's member cache when possible."""
+    member = guild.get_member(user_id) if guild else None
+    if member:
+        return member.mention
+    # Use user ID format for mentions (Discord will resolve it)
+    return f"<@{user_id}>"
+
+
 class LeaderboardView(discord.ui.View):
     """View with buttons for selecting leaderboard stat type."""
     
-    STAT_DISPLAY_NAMES = {
+    STAT_DISPLAY_NAMES = MappingProxyType({
         "wins": "Wins",
         "highest_level": "Highest Level",
         "items_collected": "Items Collected",
@@ -1236,27 +1555,40 @@ class LeaderboardView(discord.ui.View):
         "levels_completed": "Levels Completed",
         "games_completed": "Games Completed",
         "deaths": "Deaths"
-    }
+    })
+    STAT_ITEMS = tuple(STAT_DISPLAY_NAMES.items())
+    
+    # Display format per stat (other stats show the number with thousands separators)
+    STAT_VALUE_FORMATS = MappingProxyType({
+        "highest_level": "Level {}",
+        "items_collected": "{:,} items",
+        "deaths": "{:,} deaths",
+    })
     
     def __init__(self, score_manager: ScoreManager, guild_id: int, current_stat: str = "wins"):
         super().__init__(timeout=300)  # 5 minute timeout
         self.score_manager = score_manager
         self.guild_id = guild_id
         self.current_stat = current_stat
+        # Rendered embeds: {(stat_name, user_id): (scores version, embed)}
+        self._embed_cache: dict[tuple[str, int], tuple[int, discord.Embed]] = {}
     
     def format_stat_value(self, stat_name: str, value: int) -> str:
         """Format a stat value for display."""
-        if stat_name == "highest_level":
-            return f"Level {value}"
-        elif stat_name == "items_collected":
-            return f"{value:,} items"
-        elif stat_name == "deaths":
-            return f"{value:,} deaths"
-        else:
-            return f"{value:,}"
+        return self.STAT_VALUE_FORMATS.get(stat_name, "{:,}").format(value)
     
     async def create_leaderboard_embed(self, stat_name: str, user_id: int, client: discord.Client = None, guild: discord.Guild = None) -> discord.Embed:
-        """Create a leaderboard embed for the given stat."""
+        """Create a leaderboard embed for the given stat, reusing it while scores are unchanged."""
+        version = self.score_manager.get_version(self.guild_id)
+        cached = self._embed_cache.get((stat_name, user_id))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        embed = self.build_leaderboard_embed(stat_name, user_id, guild)
+        self._embed_cache[(stat_name, user_id)] = (version, embed)
+        return embed
+    
+    def build_leaderboard_embed(self, stat_name: str, user_id: int, guild: discord.Guild = None) -> discord.Embed:
+        """Build a leaderboard embed for the given stat."""
         # Get top 10 players
         leaderboard = self.score_manager.get_leaderboard(self.guild_id, stat_name, limit=10)
         
@@ -1266,7 +1598,8 @@ class LeaderboardView(discord.ui.View):
         player_value = player_stats.get(stat_name, 0)
         
         # Check if player is in top 10
-        player_in_top_10 = any(uid == user_id for uid, _ in leaderboard)
+        top_ids = {uid for uid, _ in leaderboard}
+        player_in_top_10 = user_id in top_ids
         
         # Create embed
         stat_display = self.STAT_DISPLAY_NAMES.get(stat_name, stat_name.replace("_", " ").title())
@@ -1276,51 +1609,22 @@ class LeaderboardView(discord.ui.View):
         )
         
         # Build leaderboard text
-        leaderboard_text = ""
+        rows = []
+        append_row = rows.append
         
         for rank, (uid, value) in enumerate(leaderboard, start=1):
-            try:
-                # Try to get user from guild first (faster)
-                member = None
-                if guild:
-                    member = guild.get_member(uid)
-                
-                if member:
-                    # Use mention for guild members
-                    username = member.mention
-                else:
-                    # Use user ID format for mentions (Discord will resolve it)
-                    username = f"<@{uid}>"
-            except:
-                # Fallback to user ID format
-                username = f"<@{uid}>"
-            
-            # Use number for rank
-            rank_display = f"{rank}."
+            username = get_member_mention(guild, uid)
             
             # Format: rank. @mention - value
-            leaderboard_text += f"{rank_display} {username} - {self.format_stat_value(stat_name, value)}\n"
+            append_row(f"{rank}. {username} - {self.format_stat_value(stat_name, value)}\n")
         
         # Add current player if not in top 10
         if not player_in_top_10 and player_rank is not None:
-            leaderboard_text += "\n" + "─" * 30 + "\n"
-            try:
-                # Try to get user from guild first (faster)
-                member = None
-                if guild:
-                    member = guild.get_member(user_id)
-                
-                if member:
-                    # Use mention for guild members
-                    username = member.mention
-                else:
-                    # Use user ID format for mentions (Discord will resolve it)
-                    username = f"<@{user_id}>"
-            except:
-                # Fallback to user ID format
-                username = f"<@{user_id}>"
-            leaderboard_text += f"{player_rank}. {username} - {self.format_stat_value(stat_name, player_value)}\n"
+            append_row(LEADERBOARD_SEPARATOR)
+            username = get_member_mention(guild, user_id)
+            append_row(f"{player_rank}. {username} - {self.format_stat_value(stat_name, player_value)}\n")
         
+        leaderboard_text = "".join(rows)
         if leaderboard_text:
             embed.description = leaderboard_text
         else:
@@ -1387,7 +1691,7 @@ async def leaderboard_command(interaction: discord.Interaction):
         guild_id = interaction.guild.id if interaction.guild else None
         if not guild_id:
             await interaction.response.send_message(
-                "❌ This command can only be used in a server.",
+                GUILD_ONLY_MESSAGE,
                 ephemeral=True
             )
             return
@@ -1419,14 +1723,13 @@ async def shop_command(interaction: discord.Interaction):
         guild_id = interaction.guild.id if interaction.guild else None
         if not guild_id:
             await interaction.response.send_message(
-                "❌ This command can only be used in a server.",
+                GUILD_ONLY_MESSAGE,
                 ephemeral=True
             )
             return
         
         user_id = interaction.user.id
-        stats = score_manager.get_player_stats(guild_id, user_id)
-        player_xp = stats.get("xp", 0)
+        player_xp = score_manager.get_player_xp(guild_id, user_id)
         
         shop_items = shop_manager.get_shop_items()
         
@@ -1507,8 +1810,7 @@ class ShopView(discord.ui.View):
                     return
                 
                 # Get current XP
-                stats = self.score_manager.get_player_stats(self.guild_id, self.user_id)
-                player_xp = stats.get("xp", 0)
+                player_xp = self.score_manager.get_player_xp(self.guild_id, self.user_id)
                 
                 # Attempt purchase
                 success, message = self.shop_manager.purchase_item(
@@ -1526,8 +1828,7 @@ class ShopView(discord.ui.View):
                     )
                     
                     # Update the shop embed
-                    stats = self.score_manager.get_player_stats(self.guild_id, self.user_id)
-                    player_xp = stats.get("xp", 0)
+                    player_xp = self.score_manager.get_player_xp(self.guild_id, self.user_id)
                     
                     embed = discord.Embed(
                         title="🛒 Shop",
@@ -1570,7 +1871,7 @@ async def inventory_command(interaction: discord.Interaction):
         guild_id = interaction.guild.id if interaction.guild else None
         if not guild_id:
             await interaction.response.send_message(
-                "❌ This command can only be used in a server.",
+                GUILD_ONLY_MESSAGE,
                 ephemeral=True
             )
             return
@@ -1622,7 +1923,7 @@ async def achievements_command(interaction: discord.Interaction):
         guild_id = interaction.guild.id if interaction.guild else None
         if not guild_id:
             await interaction.response.send_message(
-                "❌ This command can only be used in a server.",
+                GUILD_ONLY_MESSAGE,
                 ephemeral=True
             )
             return
@@ -1642,12 +1943,13 @@ async def achievements_command(interaction: discord.Interaction):
         
         # Group by category
         categories = get_achievements_by_category()
+        unlocked_set = set(unlocked_achievements)
         
         for category, achievement_ids in categories.items():
             category_text = ""
             for achievement_id in achievement_ids:
                 achievement_data = ACHIEVEMENTS[achievement_id]
-                is_unlocked = achievement_id in unlocked_achievements
+                is_unlocked = achievement_id in unlocked_set
                 status = "✅" if is_unlocked else "❌"
                 name = achievement_data["name"]
                 description = achievement_data["description"]
@@ -1685,7 +1987,7 @@ async def stats_command(interaction: discord.Interaction, user: Optional[discord
         guild_id = interaction.guild.id if interaction.guild else None
         if not guild_id:
             await interaction.response.send_message(
-                "❌ This command can only be used in a server.",
+                GUILD_ONLY_MESSAGE,
                 ephemeral=True
             )
             return
@@ -1731,11 +2033,12 @@ async def stats_command(interaction: discord.Interaction, user: Optional[discord
         embed.description = stats_text
         
         # Add rank information
-        rank_text = ""
-        for stat_name, display_name in LeaderboardView.STAT_DISPLAY_NAMES.items():
-            rank = score_manager.get_player_rank(guild_id, user_id, stat_name)
-            if rank is not None:
-                rank_text += f"**{display_name}**: #{rank}\n"
+        ranks = score_manager.get_player_ranks(guild_id, user_id)
+        rank_text = "".join(
+            f"**{display_name}**: #{ranks[stat_name]}\n"
+            for stat_name, display_name in LeaderboardView.STAT_ITEMS
+            if stat_name in ranks
+        )
         
         if rank_text:
             embed.add_field(
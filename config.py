@@ -40,15 +40,15 @@ PLAYER_LIVES = 3
 # Zombie movement configuration
 ZOMBIE_MOVE_INTERVAL = 2  # Zombies move every N player moves (default: 2)
 
-# Zombie count by level: (min_zombies, max_zombies)
+# Zombie count by level: (min_zombies, max_zombies), indexed by level - 1
 # More zombies spawn in later levels
-ZOMBIE_COUNT_BY_LEVEL = {
-    1: (0, 1),   # Level 1: 0-1 zombies
-    2: (1, 2),   # Level 2: 1-2 zombies
-    3: (1, 3),   # Level 3: 1-3 zombies
-    4: (2, 3),   # Level 4: 2-3 zombies
-    5: (2, 4),   # Level 5: 2-4 zombies
-}
+ZOMBIE_COUNT_BY_LEVEL = (
+    (0, 1),   # Level 1: 0-1 zombies
+    (1, 2),   # Level 2: 1-2 zombies
+    (1, 3),   # Level 3: 1-3 zombies
+    (2, 3),   # Level 4: 2-3 zombies
+    (2, 4),   # Level 5: 2-4 zombies
+)
 
 # Default zombie count for levels beyond LEVEL_CONFIGS
 DEFAULT_ZOMBIE_COUNT = (3, 5)  # 3-5 zombies for high levels
@@ -62,14 +62,14 @@ ITEM_TYPES = {
 }
 
 # Level configuration
-# Each level has: (min_items, max_items, width, height, obstacle_count)
-LEVEL_CONFIGS = {
-    1: (2, 3, 8, 5, 2),   # Level 1: 2-3 items, small field
-    2: (3, 4, 10, 6, 3),  # Level 2: 3-4 items, medium field
-    3: (4, 5, 12, 7, 4),  # Level 3: 4-5 items, larger field
-    4: (5, 6, 14, 8, 5),  # Level 4: 5-6 items, even larger
-    5: (6, 7, 16, 9, 6),  # Level 5: 6-7 items, large field
-}
+# Each level has: (min_items, max_items, width, height, obstacle_count), indexed by level - 1
+LEVEL_CONFIGS = (
+    (2, 3, 8, 5, 2),   # Level 1: 2-3 items, small field
+    (3, 4, 10, 6, 3),  # Level 2: 3-4 items, medium field
+    (4, 5, 12, 7, 4),  # Level 3: 4-5 items, larger field
+    (5, 6, 14, 8, 5),  # Level 4: 5-6 items, even larger
+    (6, 7, 16, 9, 6),  # Level 5: 6-7 items, large field
+)
 
 # Default level (if level exceeds LEVEL_CONFIGS)
 DEFAULT_LEVEL_CONFIG = (7, 8, 18, 10, 7)
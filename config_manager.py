@@ -2,7 +2,11 @@
 
 import os
 import json
-from typing import Dict, Optional, List
+import time
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Optional, List, Tuple
 from config import (
     EMOJI_WALL,
     EMOJI_OBSTACLE,
@@ -27,44 +31,86 @@ from config import (
     EMOJI_SKULL,
     ITEM_TYPES,
     PLAYER_LIVES,
+    DIRECTION_UP,
+    DIRECTION_DOWN,
+    DIRECTION_LEFT,
+    DIRECTION_RIGHT,
 )
 
+# Default emojis from config.py, built once: {emoji_key: emoji}
+DEFAULT_EMOJIS = MappingProxyType({
+    "wall": EMOJI_WALL,
+    "obstacle": EMOJI_OBSTACLE,
+    "empty": EMOJI_EMPTY,
+    "player": EMOJI_PLAYER,
+    "portal": EMOJI_PORTAL,
+    "zombie": EMOJI_ZOMBIE,
+    "diamond": EMOJI_DIAMOND,
+    "wood": EMOJI_WOOD,
+    "stone": EMOJI_STONE,
+    "coal": EMOJI_COAL,
+    "join": EMOJI_JOIN,
+    "player1": EMOJI_PLAYER1,
+    "player2": EMOJI_PLAYER2,
+    "player3": EMOJI_PLAYER3,
+    "player4": EMOJI_PLAYER4,
+    "up": EMOJI_UP,
+    "down": EMOJI_DOWN,
+    "left": EMOJI_LEFT,
+    "right": EMOJI_RIGHT,
+    "heart": EMOJI_HEART,
+    "skull": EMOJI_SKULL,
+})
+
+# Full default config, emojis plus game settings: {config_key: value}
+DEFAULT_CONFIG = MappingProxyType({
+    **DEFAULT_EMOJIS,
+    "player_lives": PLAYER_LIVES,
+})
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Consistent view of a server's emojis and game settings from a single config read."""
+    
+    __slots__ = ("emojis", "settings")
+    
+    emojis: Dict[str, str]
+    settings: Dict[str, int]
+
 
 class ConfigManager:
     """Manages server-specific emoji configurations."""
     
     CONFIGS_DIR = "configs"
+    CACHE_TTL = 60  # Seconds a cached emoji/settings read stays valid
     
     def __init__(self):
         """Initialize the config manager."""
         # Ensure configs directory exists
         os.makedirs(self.CONFIGS_DIR, exist_ok=True)
+        # Parsed configs merged with defaults: {guild_id: (file mtime_ns, config)},
+        # reread when the file's mtime changes
+        self._config_cache: Dict[int, Tuple[Optional[int], Dict]] = {}
+        # Per-guild counter bumped on every successful save, for cache invalidation
+        self._config_versions: Dict[int, int] = {}
+        # Recent reads per guild: {guild_id: (read time, value)}, dropped on save
+        self._emoji_cache: Dict[int, Tuple[float, Dict[str, str]]] = {}
+        self._settings_cache: Dict[int, Tuple[float, Dict[str, int]]] = {}
+        # Per-guild locks so concurrent updates (run in worker threads) don't drop each other's changes
+        self._update_locks: Dict[int, threading.Lock] = {}
+        self._warm_cache()
+    
+    def _warm_cache(self):
+        """Parse every saved server config once at startup."""
+        for filename in os.listdir(self.CONFIGS_DIR):
+            guild_id, ext = os.path.splitext(filename)
+            if ext == ".json" and guild_id.isdigit():
+                self.load_config(int(guild_id))
     
     def get_default_emojis(self) -> Dict[str, str]:
         """Get default emoji configuration from config.py."""
-        return {
-            "wall": EMOJI_WALL,
-            "obstacle": EMOJI_OBSTACLE,
-            "empty": EMOJI_EMPTY,
-            "player": EMOJI_PLAYER,
-            "portal": EMOJI_PORTAL,
-            "zombie": EMOJI_ZOMBIE,
-            "diamond": EMOJI_DIAMOND,
-            "wood": EMOJI_WOOD,
-            "stone": EMOJI_STONE,
-            "coal": EMOJI_COAL,
-            "join": EMOJI_JOIN,
-            "player1": EMOJI_PLAYER1,
-            "player2": EMOJI_PLAYER2,
-            "player3": EMOJI_PLAYER3,
-            "player4": EMOJI_PLAYER4,
-            "up": EMOJI_UP,
-            "down": EMOJI_DOWN,
-            "left": EMOJI_LEFT,
-            "right": EMOJI_RIGHT,
-            "heart": EMOJI_HEART,
-            "skull": EMOJI_SKULL,
-        }
+        return dict(DEFAULT_EMOJIS)
     
     def get_default_item_types(self) -> Dict[str, str]:
         """Get default item types mapping."""
@@ -72,45 +118,83 @@ class ConfigManager:
     
     def get_default_config(self) -> Dict:
         """Get default configuration including emojis and game settings."""
-        config = self.get_default_emojis()
-        config.update({
-            "player_lives": PLAYER_LIVES,
-        })
-        return config
+        return dict(DEFAULT_CONFIG)
+    
+    def _get_config_mtime(self, config_path: str) -> Optional[int]:
+        """Get a config file's modification time in nanoseconds, or None if it doesn't exist."""
+        try:
+            return os.stat(config_path).st_mtime_ns
+        except OSError:
+            return None
     
     def load_config(self, guild_id: int) -> Dict:
         """Load configuration for a specific server, fallback to defaults."""
         config_path = os.path.join(self.CONFIGS_DIR, f"{guild_id}.json")
+        mtime = self._get_config_mtime(config_path)
         
-        if os.path.exists(config_path):
+        cached = self._config_cache.get(guild_id)
+        if cached is not None and cached[0] == mtime:
+            # Callers may modify the returned config before saving it
+            return dict(cached[1])
+        
+        if mtime is not None:
             try:
                 with open(config_path, 'r', encoding='utf-8') as f:
                     config = json.load(f)
                 # Merge with defaults to ensure all keys exist
-                default_config = self.get_default_config()
-                default_config.update(config)
-                return default_config
+                default_config = {**DEFAULT_CONFIG, **config}
             except (json.JSONDecodeError, IOError) as e:
+                # Not cached, so a fixed file is picked up on the next load
                 print(f"Error loading config for guild {guild_id}: {e}")
                 return self.get_default_config()
+        else:
+            default_config = self.get_default_config()
         
-        return self.get_default_config()
+        if cached is not None:
+            # Edited outside the bot, so drop derived reads too
+            self._bump_version(guild_id)
+        self._config_cache[guild_id] = (mtime, default_config)
+        return dict(default_config)
     
     def save_config(self, guild_id: int, config: Dict[str, str]) -> bool:
         """Save configuration for a specific server."""
         config_path = os.path.join(self.CONFIGS_DIR, f"{guild_id}.json")
+        temp_path = config_path + ".tmp"
         
         try:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            data = json.dumps(config, indent=2, ensure_ascii=False)
+            # Write to a temp file and swap it in so a crash never leaves a half-written config
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(temp_path, config_path)
+            self._config_cache[guild_id] = (self._get_config_mtime(config_path), dict(config))
+            self._bump_version(guild_id)
             return True
         except IOError as e:
             print(f"Error saving config for guild {guild_id}: {e}")
             return False
     
+    def _bump_version(self, guild_id: int):
+        """Mark a server's configuration as changed and drop reads derived from it."""
+        self._config_versions[guild_id] = self._config_versions.get(guild_id, 0) + 1
+        self._emoji_cache.pop(guild_id, None)
+        self._settings_cache.pop(guild_id, None)
+    
+    def get_config_version(self, guild_id: int) -> int:
+        """Get a counter that changes whenever a server's configuration is saved."""
+        return self._config_versions.get(guild_id, 0)
+    
     def get_emojis(self, guild_id: int) -> Dict[str, str]:
         """Get emojis for a server (loads from file or returns defaults)."""
-        config = self.load_config(guild_id)
+        cached = self._emoji_cache.get(guild_id)
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return dict(cached[1])
+        emojis = self._extract_emojis(self.load_config(guild_id))
+        self._emoji_cache[guild_id] = (time.monotonic(), emojis)
+        return dict(emojis)
+    
+    def _extract_emojis(self, config: Dict) -> Dict[str, str]:
+        """Pick the emoji keys out of a loaded config."""
         # Return only emoji keys
         emoji_keys = ["wall", "obstacle", "empty", "player", "portal", "zombie", 
                       "diamond", "wood", "stone", "coal", "join", 
@@ -120,7 +204,10 @@ class ConfigManager:
     
     def get_player_emojis(self, guild_id: int) -> List[str]:
         """Get player emojis list for a server."""
-        emojis = self.get_emojis(guild_id)
+        return self._extract_player_emojis(self.get_emojis(guild_id))
+    
+    def _extract_player_emojis(self, emojis: Dict[str, str]) -> List[str]:
+        """Pick the player emojis, in join order, out of a server's emojis."""
         return [
             emojis.get("player1", EMOJI_PLAYER1),
             emojis.get("player2", EMOJI_PLAYER2),
@@ -130,26 +217,74 @@ class ConfigManager:
     
     def get_game_settings(self, guild_id: int) -> Dict[str, int]:
         """Get game settings (player_lives) for a server."""
-        config = self.load_config(guild_id)
+        cached = self._settings_cache.get(guild_id)
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return dict(cached[1])
+        settings = self._extract_settings(self.load_config(guild_id))
+        self._settings_cache[guild_id] = (time.monotonic(), settings)
+        return dict(settings)
+    
+    def _extract_settings(self, config: Dict) -> Dict[str, int]:
+        """Pick the game settings out of a loaded config."""
         return {
             "player_lives": int(config.get("player_lives", PLAYER_LIVES)),
         }
     
+    def get_snapshot(self, guild_id: int) -> ConfigSnapshot:
+        """Get emojis and game settings for a server from one config read."""
+        config = self.load_config(guild_id)
+        return ConfigSnapshot(
+            emojis=self._extract_emojis(config),
+            settings=self._extract_settings(config),
+        )
+    
+    def _get_update_lock(self, guild_id: int) -> threading.Lock:
+        """Get the lock serializing config updates for a server."""
+        lock = self._update_locks.get(guild_id)
+        if lock is None:
+            # setdefault is atomic, so racing threads still end up sharing one lock
+            lock = self._update_locks.setdefault(guild_id, threading.Lock())
+        return lock
+    
     def update_emoji(self, guild_id: int, emoji_key: str, emoji_value: str) -> bool:
         """Update a single emoji for a server."""
-        config = self.load_config(guild_id)
-        config[emoji_key] = emoji_value
-        return self.save_config(guild_id, config)
+        with self._get_update_lock(guild_id):
+            config = self.load_config(guild_id)
+            if config.get(emoji_key) == emoji_value:
+                return True  # Already set, skip the write
+            config[emoji_key] = emoji_value
+            return self.save_config(guild_id, config)
     
     def update_setting(self, guild_id: int, setting_key: str, setting_value) -> bool:
         """Update a game setting (player_lives) for a server."""
+        with self._get_update_lock(guild_id):
+            config = self.load_config(guild_id)
+            if config.get(setting_key) == setting_value:
+                return True  # Already set, skip the write
+            config[setting_key] = setting_value
+            return self.save_config(guild_id, config)
+    
+    def get_all(self, guild_id: int) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, int], Dict[str, tuple], List[str]]:
+        """Get everything a game needs for a server from one config read.
+        
+        Returns (emojis, item_types, settings, emoji_to_direction, player_emojis).
+        """
         config = self.load_config(guild_id)
-        config[setting_key] = setting_value
-        return self.save_config(guild_id, config)
+        emojis = self._extract_emojis(config)
+        return (
+            emojis,
+            self._extract_item_types(emojis),
+            self._extract_settings(config),
+            self._extract_emoji_to_direction(emojis),
+            self._extract_player_emojis(emojis),
+        )
     
     def get_item_types(self, guild_id: int) -> Dict[str, str]:
         """Get item types mapping for a server."""
-        emojis = self.get_emojis(guild_id)
+        return self._extract_item_types(self.get_emojis(guild_id))
+    
+    def _extract_item_types(self, emojis: Dict[str, str]) -> Dict[str, str]:
+        """Pick the item emojis out of a server's emojis."""
         return {
             "diamond": emojis["diamond"],
             "wood": emojis["wood"],
@@ -159,9 +294,10 @@ class ConfigManager:
     
     def get_emoji_to_direction(self, guild_id: int) -> Dict[str, tuple]:
         """Get emoji to direction mapping for a server."""
-        from config import DIRECTION_UP, DIRECTION_DOWN, DIRECTION_LEFT, DIRECTION_RIGHT
-        
-        emojis = self.get_emojis(guild_id)
+        return self._extract_emoji_to_direction(self.get_emojis(guild_id))
+    
+    def _extract_emoji_to_direction(self, emojis: Dict[str, str]) -> Dict[str, tuple]:
+        """Map a server's movement emojis to directions."""
         return {
             emojis["up"]: DIRECTION_UP,
             emojis["down"]: DIRECTION_DOWN,
@@ -1,7 +1,9 @@
 """Game logic for the text-based movement game."""
 
 import random
-from typing import Tuple, Set, Dict, Optional, List
+from collections import Counter
+from types import MappingProxyType
+from typing import Tuple, Set, FrozenSet, Dict, Optional, List, Mapping, Counter as CounterType
 from config import (
     OBSTACLE_COUNT,
     EMOJI_WALL,
@@ -17,15 +19,36 @@ from config import (
     ZOMBIE_MOVE_INTERVAL,
     ZOMBIE_COUNT_BY_LEVEL,
     DEFAULT_ZOMBIE_COUNT,
+    DIRECTION_UP,
+    DIRECTION_DOWN,
+    DIRECTION_LEFT,
+    DIRECTION_RIGHT,
 )
 
 # Default player emojis (fallback if not configured)
 DEFAULT_PLAYER_EMOJIS = ["🟢", "🔵", "🟡", "🟣"]
 
+# Shared read-only result for players without an inventory or active power-ups
+EMPTY_MAPPING = MappingProxyType({})
+
+# Directions a zombie may step in, as (dx, dy)
+ZOMBIE_DIRECTIONS = (DIRECTION_UP, DIRECTION_DOWN, DIRECTION_LEFT, DIRECTION_RIGHT)
+
 
 class Game:
     """Manages a single game instance for multiple players."""
     
+    __slots__ = (
+        "level", "player_emojis_list", "emojis", "item_types", "_item_type_list", "_empty_inventory",
+        "width", "height", "obstacle_count", "required_items_count",
+        "obstacles", "_occupied", "_base_grid", "_render_emojis", "_border_row",
+        "players", "player_positions", "collected_items", "total_collected",
+        "player_lives", "player_emojis", "player_wins", "player_deaths",
+        "last_move_deaths", "winner",
+        "items", "portal_pos", "level_complete", "zombies", "zombie_move_counter",
+        "player_powerups", "active_powerups", "game_over",
+    )
+    
     def __init__(self, level: int = 1, player_lives: Optional[int] = None, emojis: Optional[Dict[str, str]] = None, item_types: Optional[Dict[str, str]] = None, first_player_id: Optional[int] = None, player_emojis: Optional[List[str]] = None):
         """Initialize a new game for the specified level.
         
@@ -63,10 +86,13 @@ class Game:
             self.item_types = ITEM_TYPES.copy()
         else:
             self.item_types = item_types.copy()
+        self._item_type_list = tuple(self.item_types)
+        # Fresh inventories are copies of this
+        self._empty_inventory: Dict[str, int] = dict.fromkeys(self.item_types, 0)
         
         # Get level configuration
-        if level in LEVEL_CONFIGS:
-            min_items, max_items, width, height, obstacle_count = LEVEL_CONFIGS[level]
+        if 1 <= level <= len(LEVEL_CONFIGS):
+            min_items, max_items, width, height, obstacle_count = LEVEL_CONFIGS[level - 1]
         else:
             min_items, max_items, width, height, obstacle_count = DEFAULT_LEVEL_CONFIG
         
@@ -104,30 +130,36 @@ class Game:
         self.obstacle_count = obstacle_count
         self.required_items_count = random.randint(min_items, max_items)
         
-        # Generate obstacles
-        self.obstacles: Set[Tuple[int, int]] = self._generate_obstacles()
+        # Place obstacles, collectible items and the portal (crafting table) before players join
+        spare_cells = self._populate_board()
+        # Empty cells and obstacles never change, so render starts from a copy of these rows
+        self._base_grid: List[List[str]] = [[self.emojis["empty"]] * self.width for _ in range(self.height)]
+        for x, y in self.obstacles:
+            self._base_grid[y][x] = self.emojis["obstacle"]
+        # Emojis render paints every frame: (wall, empty, portal, zombie)
+        self._render_emojis: Tuple[str, str, str, str] = (
+            self.emojis["wall"], self.emojis["empty"], self.emojis["portal"], self.emojis["zombie"],
+        )
+        # Top and bottom wall rows
+        self._border_row = self._render_emojis[0] * (self.width + 2)
         
         # Multiplayer structures
         self.players: List[int] = []  # Track player order
         self.player_positions: Dict[int, Tuple[int, int]] = {}  # user_id -> position
         self.collected_items: Dict[int, Dict[str, int]] = {}  # user_id -> {item_type: count}
+        self.total_collected: Dict[int, int] = {}  # user_id -> items collected (running sum of collected_items)
         self.player_lives: Dict[int, int] = {}  # user_id -> lives
         self.player_emojis: Dict[int, str] = {}  # user_id -> emoji
         self.player_wins: Dict[int, int] = {}  # user_id -> win count
         self.player_deaths: Dict[int, int] = {}  # user_id -> death count (for this game)
+        self.last_move_deaths: List[int] = []  # user_ids who died during the most recent move
         self.winner: Optional[int] = None  # user_id of winner
         
-        # Generate collectible items (before placing players)
-        self.items: Dict[Tuple[int, int], str] = {}
-        
-        # Generate portal (crafting table)
-        self.portal_pos: Optional[Tuple[int, int]] = None
-        
         # Track if level is complete
         self.level_complete = False
         
         # Zombie tracking
-        self.zombies: List[Tuple[int, int]] = []
+        self.zombies: CounterType[Tuple[int, int]] = Counter()  # position -> zombies on that cell
         self.zombie_move_counter = 0
         
         # Power-up tracking
@@ -140,29 +172,50 @@ class Game:
         # Game over flag
         self.game_over = False
         
-        # Generate items and portal first (before placing players)
-        self.items = self._generate_items()
-        self.portal_pos = self._generate_portal()
-        
         # Add first player if provided
         if first_player_id is not None:
             self.add_player(first_player_id, player_lives if player_lives is not None else PLAYER_LIVES)
         
-        # Generate zombies (after players are placed)
-        self.zombies = self._generate_zombies()
+        # Generate zombies (after players are placed) from the cells the board left free
+        self.zombies = self._generate_zombies(spare_cells)
+    
+    def _free_cells(self, blocked: Set[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """List every field position not in the blocked set."""
+        return [
+            (x, y)
+            for y in range(self.height)
+            for x in range(self.width)
+            if (x, y) not in blocked
+        ]
     
-    def _generate_obstacles(self) -> Set[Tuple[int, int]]:
-        """Generate random obstacles, ensuring they don't overlap."""
-        obstacles = set()
-        max_attempts = 100
-        
-        while len(obstacles) < self.obstacle_count and max_attempts > 0:
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            obstacles.add((x, y))
-            max_attempts -= 1
-        
-        return obstacles
+    def _populate_board(self) -> List[Tuple[int, int]]:
+        """Place obstacles, items and the portal from a single shuffle of the field.
+        
+        Returns:
+            The cells left unused, still in shuffled order
+        """
+        cells = self._free_cells(set())
+        random.shuffle(cells)
+        
+        obstacle_count = min(self.obstacle_count, len(cells))
+        # Obstacles never move once placed
+        self.obstacles: FrozenSet[Tuple[int, int]] = frozenset(cells[:obstacle_count])
+        
+        # Generate more items than required to give players choice
+        items_to_generate = self.required_items_count + random.randint(2, 4)
+        item_cells = cells[obstacle_count:obstacle_count + items_to_generate]
+        # Pick every item's type in one call
+        self.items: Dict[Tuple[int, int], str] = dict(
+            zip(item_cells, random.choices(self._item_type_list, k=len(item_cells)))
+        )
+        
+        portal_index = obstacle_count + len(item_cells)
+        self.portal_pos: Optional[Tuple[int, int]] = cells[portal_index] if portal_index < len(cells) else None
+        
+        # Cells taken by obstacles, items and the portal (kept in sync as items are collected)
+        self._occupied: Set[Tuple[int, int]] = set(cells[:portal_index + 1])
+        
+        return cells[portal_index + 1:]
     
     def _generate_start_position(self, exclude_positions: Optional[Set[Tuple[int, int]]] = None) -> Optional[Tuple[int, int]]:
         """Generate a starting position that's not on an obstacle or excluded positions.
@@ -176,207 +229,103 @@ class Game:
         if exclude_positions is None:
             exclude_positions = set()
         
-        blocked = set(self.obstacles) | exclude_positions
-        max_attempts = 200
-        
-        for _ in range(max_attempts):
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            pos = (x, y)
-            if pos not in blocked:
-                return pos
-        
-        # If random failed, try all positions systematically
-        for y in range(self.height):
-            for x in range(self.width):
-                pos = (x, y)
-                if pos not in blocked:
-                    return pos
-        
-        return None
-    
-    def _generate_items(self) -> Dict[Tuple[int, int], str]:
-        """Generate collectible items randomly on the field."""
-        items = {}
-        item_types_list = list(self.item_types.keys())
-        max_attempts = 200
-        
-        # Generate more items than required to give players choice
-        items_to_generate = self.required_items_count + random.randint(2, 4)
-        
-        attempts = 0
-        while len(items) < items_to_generate and attempts < max_attempts:
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            pos = (x, y)
-            
-            # Don't place on obstacles or player positions
-            blocked = set(self.obstacles) | set(self.player_positions.values())
-            if pos not in blocked:
-                # Randomly select an item type
-                item_type = random.choice(item_types_list)
-                items[pos] = item_type
-            attempts += 1
-        
-        return items
+        free = self._free_cells(self.obstacles | exclude_positions)
+        return random.choice(free) if free else None
     
-    def _generate_portal(self) -> Optional[Tuple[int, int]]:
-        """Generate portal position that's not on obstacles, player positions, or items."""
-        # First try random positions
-        max_attempts = 100
-        attempts = 0
-        
-        blocked = set(self.obstacles) | set(self.player_positions.values()) | set(self.items.keys())
-        
-        while attempts < max_attempts:
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            pos = (x, y)
-            
-            # Don't place on obstacles, player positions, or items
-            if pos not in blocked:
-                return pos
-            attempts += 1
-        
-        # If random failed, try all positions systematically
-        for y in range(self.height):
-            for x in range(self.width):
-                pos = (x, y)
-                if pos not in blocked:
-                    return pos
-        
-        # If still no position found, return None (shouldn't happen in normal cases)
-        return None
-    
-    def _generate_zombies(self) -> List[Tuple[int, int]]:
-        """Generate zombies randomly on the field, avoiding obstacles, player positions, items, and portal."""
-        zombies = []
+    def _generate_zombies(self, spare_cells: Optional[List[Tuple[int, int]]] = None) -> CounterType[Tuple[int, int]]:
+        """Generate zombies randomly on the field, avoiding obstacles, player positions, items, and portal.
         
+        Args:
+            spare_cells: Shuffled cells left free by _populate_board, to draw from instead of rescanning the field
+        """
         # Get zombie count for this level
-        if self.level in ZOMBIE_COUNT_BY_LEVEL:
-            min_zombies, max_zombies = ZOMBIE_COUNT_BY_LEVEL[self.level]
+        if 1 <= self.level <= len(ZOMBIE_COUNT_BY_LEVEL):
+            min_zombies, max_zombies = ZOMBIE_COUNT_BY_LEVEL[self.level - 1]
         else:
             min_zombies, max_zombies = DEFAULT_ZOMBIE_COUNT
         
         zombie_count = random.randint(min_zombies, max_zombies)
         
-        # Collect all blocked positions
-        blocked_positions = set(self.obstacles)
-        blocked_positions.update(self.player_positions.values())
-        blocked_positions.update(self.items.keys())
-        if self.portal_pos is not None:
-            blocked_positions.add(self.portal_pos)
+        if spare_cells is not None:
+            # Already shuffled, so the first free cells are a random pick
+            player_cells = set(self.player_positions.values())
+            free = [pos for pos in spare_cells if pos not in player_cells]
+            return Counter(free[:zombie_count])
         
-        max_attempts = 200
-        attempts = 0
+        # Collect all blocked positions (obstacles, items, portal and players)
+        free = self._free_cells(self._occupied | set(self.player_positions.values()))
         
-        while len(zombies) < zombie_count and attempts < max_attempts:
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            pos = (x, y)
-            
-            # Don't place on blocked positions
-            if pos not in blocked_positions:
-                zombies.append(pos)
-                blocked_positions.add(pos)  # Prevent multiple zombies on same spot initially
-            attempts += 1
-        
-        return zombies
-    
-    def _can_zombie_move(self, zombie_pos: Tuple[int, int], dx: int, dy: int) -> bool:
-        """Check if a zombie can move in the given direction."""
-        new_x = zombie_pos[0] + dx
-        new_y = zombie_pos[1] + dy
-        
-        # Check boundaries
-        if new_x < 0 or new_x >= self.width or new_y < 0 or new_y >= self.height:
-            return False
-        
-        # Check obstacles (zombies cannot move through obstacles)
-        if (new_x, new_y) in self.obstacles:
-            return False
-        
-        return True
+        # Distinct cells, so no two zombies start on the same spot
+        return Counter(random.sample(free, min(zombie_count, len(free))))
     
     def _move_zombies(self) -> None:
         """Move all zombies using weighted random movement toward the nearest player."""
-        from config import DIRECTION_UP, DIRECTION_DOWN, DIRECTION_LEFT, DIRECTION_RIGHT
+        if not self.zombies or not self.player_positions:
+            return  # Nothing to move, or no players to target
         
-        if not self.player_positions:
-            return  # No players to target
+        # Zombies stepping onto the same cell stack there
+        new_zombie_positions = Counter()
+        # Bound once for the per-zombie, per-direction checks below
+        width = self.width
+        height = self.height
+        obstacles = self.obstacles
         
-        new_zombie_positions = []
+        # Player positions don't change while zombies move, so gather them once
+        player_cells = tuple(self.player_positions.values())
         
-        for zombie_pos in self.zombies:
-            # Find nearest player
-            nearest_player_pos = None
-            min_distance = float('inf')
+        for zombie_pos, zombie_count in self.zombies.items():
+            zombie_x, zombie_y = zombie_pos
             
-            for player_pos in self.player_positions.values():
-                dx_to_player = player_pos[0] - zombie_pos[0]
-                dy_to_player = player_pos[1] - zombie_pos[1]
-                distance = abs(dx_to_player) + abs(dy_to_player)
+            # Find nearest player (Manhattan distance)
+            target_x, target_y = player_cells[0]
+            min_distance = abs(target_x - zombie_x) + abs(target_y - zombie_y)
+            for player_x, player_y in player_cells:
+                distance = abs(player_x - zombie_x) + abs(player_y - zombie_y)
                 if distance < min_distance:
                     min_distance = distance
-                    nearest_player_pos = player_pos
-            
-            if nearest_player_pos is None:
-                # No players, stay in place
-                new_zombie_positions.append(zombie_pos)
-                continue
-            
-            # Calculate distance to nearest player
-            dx_to_player = nearest_player_pos[0] - zombie_pos[0]
-            dy_to_player = nearest_player_pos[1] - zombie_pos[1]
+                    target_x, target_y = player_x, player_y
             
             # Get all possible moves
             possible_moves = []
             move_weights = []
             
-            directions = [
-                (DIRECTION_UP[0], DIRECTION_UP[1], "up"),
-                (DIRECTION_DOWN[0], DIRECTION_DOWN[1], "down"),
-                (DIRECTION_LEFT[0], DIRECTION_LEFT[1], "left"),
-                (DIRECTION_RIGHT[0], DIRECTION_RIGHT[1], "right"),
-            ]
-            
-            for dx, dy, name in directions:
-                if self._can_zombie_move(zombie_pos, dx, dy):
-                    new_pos = (zombie_pos[0] + dx, zombie_pos[1] + dy)
+            for dx, dy in ZOMBIE_DIRECTIONS:
+                new_x = zombie_x + dx
+                new_y = zombie_y + dy
+                # Zombies stay on the board and cannot move through obstacles
+                if 0 <= new_x < width and 0 <= new_y < height and (new_x, new_y) not in obstacles:
                     # Calculate new distance to nearest player
-                    new_dx = nearest_player_pos[0] - new_pos[0]
-                    new_dy = nearest_player_pos[1] - new_pos[1]
-                    old_distance = abs(dx_to_player) + abs(dy_to_player)
-                    new_distance = abs(new_dx) + abs(new_dy)
+                    new_distance = abs(target_x - new_x) + abs(target_y - new_y)
                     
                     # Weight: moves that reduce distance get higher weight
                     # Moves that increase distance get lower weight
                     # Moves that keep same distance get medium weight
-                    if new_distance < old_distance:
-                        weight = 3  # Prefer moves toward player
-                    elif new_distance == old_distance:
-                        weight = 1  # Neutral moves
+                    if new_distance < min_distance:
+                        weight = 6  # Prefer moves toward player
+                    elif new_distance == min_distance:
+                        weight = 2  # Neutral moves
                     else:
-                        weight = 0.5  # Discourage moves away from player
+                        weight = 1  # Discourage moves away from player
                     
-                    possible_moves.append((dx, dy))
+                    possible_moves.append((new_x, new_y))
                     move_weights.append(weight)
             
             # If no valid moves, stay in place
             if not possible_moves:
-                new_zombie_positions.append(zombie_pos)
+                new_zombie_positions[zombie_pos] += zombie_count
                 continue
             
-            # Weighted random selection
-            if sum(move_weights) > 0:
-                chosen_move = random.choices(possible_moves, weights=move_weights, k=1)[0]
-            else:
-                # Fallback to random if all weights are 0 (shouldn't happen)
-                chosen_move = random.choice(possible_moves)
-            
-            # Apply the move
-            new_pos = (zombie_pos[0] + chosen_move[0], zombie_pos[1] + chosen_move[1])
-            new_zombie_positions.append(new_pos)
+            # Zombies sharing a cell see the same moves but each picks its own
+            total_weight = sum(move_weights)
+            for _ in range(zombie_count):
+                # Weighted random selection over at most four integer weights
+                r = random.randrange(total_weight)
+                for new_pos, weight in zip(possible_moves, move_weights):
+                    if r < weight:
+                        break
+                    r -= weight
+                
+                new_zombie_positions[new_pos] += 1
         
         self.zombies = new_zombie_positions
     
@@ -395,8 +344,8 @@ class Game:
                 # Collision detected - reduce lives
                 self.player_lives[user_id] -= 1
                 
-                # Remove all zombies at player's position to prevent immediate re-kill
-                self.zombies = [z for z in self.zombies if z != player_pos]
+                # Remove the zombies at player's position to prevent immediate re-kill
+                del self.zombies[player_pos]
                 
                 # Check if player is out of lives
                 if self.player_lives[user_id] <= 0:
@@ -404,6 +353,7 @@ class Game:
                     if user_id not in self.player_deaths:
                         self.player_deaths[user_id] = 0
                     self.player_deaths[user_id] += 1
+                    self.last_move_deaths.append(user_id)
                     # Remove player from game
                     self.remove_player(user_id)
         
@@ -421,23 +371,20 @@ class Game:
         new_y = player_pos[1] + dy
         
         # Check boundaries
-        if new_x < 0 or new_x >= self.width or new_y < 0 or new_y >= self.height:
+        if not (0 <= new_x < self.width and 0 <= new_y < self.height):
             return False
         
         # Check obstacles
         if (new_x, new_y) in self.obstacles:
             return False
         
-        # Check if position is occupied by another player
-        new_pos = (new_x, new_y)
-        for other_user_id, other_pos in self.player_positions.items():
-            if other_user_id != user_id and other_pos == new_pos:
-                return False
-        
-        return True
+        # Check if position is occupied by another player (a step always leaves the player's own cell)
+        return (new_x, new_y) not in self.player_positions.values()
     
     def move(self, user_id: int, dx: int, dy: int) -> bool:
         """Move the player in the given direction. Returns True if move was successful."""
+        self.last_move_deaths = []
+        
         # Don't allow moves if game is over or player doesn't exist
         if self.game_over or user_id not in self.player_positions:
             return False
@@ -460,9 +407,12 @@ class Game:
             if new_pos in self.items:
                 item_type = self.items[new_pos]
                 if user_id not in self.collected_items:
-                    self.collected_items[user_id] = {item_type: 0 for item_type in self.item_types.keys()}
+                    self.collected_items[user_id] = self._empty_inventory.copy()
+                    self.total_collected[user_id] = 0
                 self.collected_items[user_id][item_type] += 1
+                self.total_collected[user_id] += 1
                 del self.items[new_pos]
+                self._occupied.discard(new_pos)
             
             # Check if player reached portal (and has required items)
             if self.portal_pos is not None and new_pos == self.portal_pos and self.can_reach_portal(user_id):
@@ -481,19 +431,21 @@ class Game:
             if speed_boost_active:
                 self._apply_speed_boost_move(user_id)
             
-            # Check for zombie collisions after player move
-            self._check_zombie_collision()
-            
-            # Increment zombie move counter
-            self.zombie_move_counter += 1
-            
-            # Move zombies every ZOMBIE_MOVE_INTERVAL moves
-            if self.zombie_move_counter >= ZOMBIE_MOVE_INTERVAL:
-                self._move_zombies()
-                self.zombie_move_counter = 0
-                
-                # Check for zombie collisions after zombie movement
+            # Zombies never respawn within a level, so a zombie-free board skips all of this
+            if self.zombies:
+                # Check for zombie collisions after player move
                 self._check_zombie_collision()
+                
+                # Increment zombie move counter
+                self.zombie_move_counter += 1
+                
+                # Move zombies every ZOMBIE_MOVE_INTERVAL moves
+                if self.zombie_move_counter >= ZOMBIE_MOVE_INTERVAL:
+                    self._move_zombies()
+                    self.zombie_move_counter = 0
+                    
+                    # Check for zombie collisions after zombie movement
+                    self._check_zombie_collision()
             
             return True
         return False
@@ -516,9 +468,7 @@ class Game:
         emoji = self.player_emojis_list[emoji_index]
         
         # Generate starting position (avoid obstacles, other players, items, portal)
-        exclude_positions = set(self.player_positions.values()) | set(self.items.keys())
-        if self.portal_pos is not None:
-            exclude_positions.add(self.portal_pos)
+        exclude_positions = self._occupied | set(self.player_positions.values())
         
         start_pos = self._generate_start_position(exclude_positions)
         if start_pos is None:
@@ -529,7 +479,8 @@ class Game:
         self.player_positions[user_id] = start_pos
         self.player_emojis[user_id] = emoji
         self.player_lives[user_id] = player_lives if player_lives is not None else PLAYER_LIVES
-        self.collected_items[user_id] = {item_type: 0 for item_type in self.item_types.keys()}
+        self.collected_items[user_id] = self._empty_inventory.copy()
+        self.total_collected[user_id] = 0
         # Initialize wins if not already set (for new players)
         if user_id not in self.player_wins:
             self.player_wins[user_id] = 0
@@ -542,6 +493,7 @@ class Game:
             del self.player_positions[user_id]
             if user_id in self.collected_items:
                 del self.collected_items[user_id]
+                del self.total_collected[user_id]
             if user_id in self.player_lives:
                 del self.player_lives[user_id]
             if user_id in self.player_emojis:
@@ -558,6 +510,10 @@ class Game:
         """Get death count for a player in this game."""
         return self.player_deaths.get(user_id, 0)
     
+    def get_last_move_deaths(self) -> List[int]:
+        """Get user_ids of players who died during the most recent move."""
+        return self.last_move_deaths
+    
     @classmethod
     def create_next_level(cls, previous_game: 'Game') -> 'Game':
         """Create a new game instance for the next level, preserving player data.
@@ -581,33 +537,29 @@ class Game:
         )
         
         # Preserve player data: emojis, lives, wins, deaths, power-ups
-        for user_id in previous_game.players:
-            # Preserve emoji assignment
-            new_game.player_emojis[user_id] = previous_game.player_emojis[user_id]
-            # Preserve lives
-            new_game.player_lives[user_id] = previous_game.player_lives[user_id]
-            # Preserve wins
-            new_game.player_wins[user_id] = previous_game.player_wins[user_id]
-            # Preserve deaths (accumulated across levels in this game session)
-            new_game.player_deaths[user_id] = previous_game.player_deaths.get(user_id, 0)
-            # Preserve power-ups (but reset active power-ups)
-            new_game.player_powerups[user_id] = previous_game.player_powerups.get(user_id, {}).copy()
-            new_game.active_powerups[user_id] = {}
-            # Reset inventory for new level
-            new_game.collected_items[user_id] = {item_type: 0 for item_type in new_game.item_types.keys()}
-            # Add to players list
-            new_game.players.append(user_id)
-        
-        # Generate starting positions for all players
-        exclude_positions = set(new_game.items.keys())
-        if new_game.portal_pos is not None:
-            exclude_positions.add(new_game.portal_pos)
-        
-        for user_id in new_game.players:
-            start_pos = new_game._generate_start_position(exclude_positions)
-            if start_pos is not None:
-                new_game.player_positions[user_id] = start_pos
-                exclude_positions.add(start_pos)  # Prevent other players from spawning here
+        players = previous_game.players
+        new_game.players = list(players)
+        # Only players still in the game have emojis and lives, so copy those whole
+        new_game.player_emojis = previous_game.player_emojis.copy()
+        new_game.player_lives = previous_game.player_lives.copy()
+        # Wins outlive removed players, so keep just the ones still playing
+        new_game.player_wins = {user_id: previous_game.player_wins[user_id] for user_id in players}
+        # Deaths accumulate across levels in this game session
+        new_game.player_deaths = {user_id: previous_game.player_deaths.get(user_id, 0) for user_id in players}
+        # Keep power-ups but reset active power-ups
+        new_game.player_powerups = {user_id: previous_game.player_powerups.get(user_id, {}).copy() for user_id in players}
+        new_game.active_powerups = {user_id: {} for user_id in players}
+        # Reset inventory for new level
+        new_game.collected_items = {user_id: new_game._empty_inventory.copy() for user_id in players}
+        new_game.total_collected = dict.fromkeys(players, 0)
+        
+        # Generate starting positions for all players (avoid obstacles, items, portal)
+        free = new_game._free_cells(new_game._occupied)
+        start_positions = random.sample(free, min(len(new_game.players), len(free)))
+        
+        # Distinct cells, so no two players spawn on the same spot
+        for user_id, start_pos in zip(new_game.players, start_positions):
+            new_game.player_positions[user_id] = start_pos
         
         # Reset level completion state
         new_game.level_complete = False
@@ -626,26 +578,23 @@ class Game:
     
     def can_reach_portal(self, user_id: int) -> bool:
         """Check if player has collected enough items to use the portal."""
-        if user_id not in self.collected_items:
+        if user_id not in self.total_collected:
             return False
-        total_collected = sum(self.collected_items[user_id].values())
-        return total_collected >= self.required_items_count
+        return self.total_collected[user_id] >= self.required_items_count
     
     def is_level_complete(self) -> bool:
         """Check if the level is complete."""
         return self.level_complete
     
-    def get_inventory(self, user_id: int) -> Dict[str, int]:
-        """Get current inventory for a player."""
+    def get_inventory(self, user_id: int) -> Mapping[str, int]:
+        """Get a read-only view of a player's current inventory."""
         if user_id not in self.collected_items:
-            return {}
-        return self.collected_items[user_id].copy()
+            return EMPTY_MAPPING
+        return MappingProxyType(self.collected_items[user_id])
     
     def get_total_collected(self, user_id: int) -> int:
         """Get total number of items collected by a player."""
-        if user_id not in self.collected_items:
-            return 0
-        return sum(self.collected_items[user_id].values())
+        return self.total_collected.get(user_id, 0)
     
     def load_powerups(self, user_id: int, powerup_inventory: Dict[str, int]) -> None:
         """Load power-ups from shop inventory into game.
@@ -771,64 +720,45 @@ class Game:
         """
         return self.player_powerups.get(user_id, {}).copy()
     
-    def get_active_powerups(self, user_id: int) -> Dict[str, any]:
+    def get_active_powerups(self, user_id: int) -> Mapping[str, any]:
         """Get active power-ups for a player.
         
         Args:
             user_id: Discord user ID
             
         Returns:
-            Dictionary of active power-ups
+            Read-only view of the player's active power-ups
         """
-        return self.active_powerups.get(user_id, {}).copy()
+        active = self.active_powerups.get(user_id)
+        if active is None:
+            return EMPTY_MAPPING
+        return MappingProxyType(active)
     
     def render(self) -> str:
         """Render the game field as a string using emojis."""
-        lines = []
-        
-        # Convert zombies list to set for faster membership checking
-        zombie_positions = set(self.zombies)
-        
-        # Create position to player emoji mapping
-        position_to_player_emoji = {pos: emoji for pos, emoji in 
-                                    zip(self.player_positions.values(), 
-                                        [self.player_emojis[uid] for uid in self.player_positions.keys()])}
-        
-        # Top wall
-        lines.append(self.emojis["wall"] * (self.width + 2))
-        
-        # Game field
-        for y in range(self.height):
-            line = self.emojis["wall"]  # Left wall
-            for x in range(self.width):
-                pos = (x, y)
-                # Rendering priority: players > portal > zombies > items > obstacles > empty
-                if pos in position_to_player_emoji:
-                    # Show player with their emoji
-                    line += position_to_player_emoji[pos]
-                elif self.portal_pos is not None and pos == self.portal_pos:
-                    # Show portal only if at least one player can reach it
-                    can_any_reach = any(self.can_reach_portal(uid) for uid in self.player_positions.keys())
-                    if can_any_reach:
-                        line += self.emojis["portal"]
-                    else:
-                        # Show as empty if portal not active yet
-                        line += self.emojis["empty"]
-                elif pos in zombie_positions:
-                    line += self.emojis["zombie"]
-                elif pos in self.items:
-                    # Show item emoji
-                    item_type = self.items[pos]
-                    line += self.item_types[item_type]
-                elif pos in self.obstacles:
-                    line += self.emojis["obstacle"]
-                else:
-                    line += self.emojis["empty"]
-            line += self.emojis["wall"]  # Right wall
-            lines.append(line)
-        
-        # Bottom wall
-        lines.append(self.emojis["wall"] * (self.width + 2))
-        
-        return "\n".join(lines)
-
+        wall, empty, portal, zombie_emoji = self._render_emojis
+        
+        # Paint layers from lowest to highest rendering priority:
+        # empty < obstacles < items < zombies < portal < players
+        # (empty cells and obstacles come prepainted)
+        grid = [row.copy() for row in self._base_grid]
+        
+        item_types = self.item_types
+        for (x, y), item_type in self.items.items():
+            grid[y][x] = item_types[item_type]
+        
+        for x, y in self.zombies:
+            grid[y][x] = zombie_emoji
+        
+        if self.portal_pos is not None:
+            # Show portal only if at least one player can reach it, otherwise as empty
+            can_any_reach = any(self.can_reach_portal(uid) for uid in self.player_positions.keys())
+            x, y = self.portal_pos
+            grid[y][x] = portal if can_any_reach else empty
+        
+        # Show players with their emoji
+        for user_id, (x, y) in self.player_positions.items():
+            grid[y][x] = self.player_emojis[user_id]
+        
+        border = self._border_row
+        return "\n".join([border, *(wall + "".join(row) + wall for row in grid), border])
@@ -0,0 +1,25 @@
+"""JSON encoding for the per-server data files, using orjson when it is installed."""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, the standard library works the same
+    orjson = None
+
+
+def loads(data: bytes):
+    """Parse JSON from the raw bytes of a file.
+
+    Raises json.JSONDecodeError on invalid input (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes, ready to write to a file."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
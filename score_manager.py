@@ -3,13 +3,21 @@
 import os
 import json
 import math
-from typing import Dict, Optional, List, Tuple
+import heapq
+import asyncio
+from collections import OrderedDict
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Optional, List, Set, Tuple
+import json_codec
 
 
 class ScoreManager:
     """Manages player scores and statistics per server."""
     
     SCORES_DIR = "scores"
+    SAVE_DELAY = 0.25  # Seconds to coalesce score changes before writing them to disk
+    CACHE_SIZE = 256  # Most servers whose parsed scores are kept in memory
     
     # Valid stat names
     STAT_NAMES = [
@@ -21,18 +29,51 @@ class ScoreManager:
         "games_completed",
         "deaths"
     ]
+    # For O(1) stat name validation
+    STAT_NAME_SET = frozenset(STAT_NAMES)
+    # Stats of a player with no recorded games, copied for new entries
+    DEFAULT_STATS = MappingProxyType({stat: 0 for stat in STAT_NAMES})
     
     def __init__(self):
         """Initialize the score manager."""
         # Ensure scores directory exists
         os.makedirs(self.SCORES_DIR, exist_ok=True)
+        # Per-guild counter bumped on every successful save, for cache invalidation
+        self._versions: Dict[int, int] = {}
+        # Parsed scores: {guild_id: (file mtime_ns, scores)}, reread when the file's mtime changes
+        # Ordered from least to most recently used so the oldest server is evicted first
+        self._scores_cache: "OrderedDict[int, Tuple[Optional[int], Dict[str, Dict[str, int]]]]" = OrderedDict()
+        # Guilds whose cached scores have changes not yet written to disk
+        self._dirty: Set[int] = set()
+        # Pending flush of the dirty guilds, if one is scheduled
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._warm_cache()
+    
+    def _warm_cache(self):
+        """Parse saved servers' scores once at startup, up to the cache size."""
+        for filename in os.listdir(self.SCORES_DIR):
+            if len(self._scores_cache) >= self.CACHE_SIZE:
+                break
+            guild_id, ext = os.path.splitext(filename)
+            if ext == ".json" and guild_id.isdigit():
+                self._read_scores(int(guild_id))
     
     def _get_scores_path(self, guild_id: int) -> str:
         """Get the path to the scores file for a guild."""
         return os.path.join(self.SCORES_DIR, f"{guild_id}.json")
     
-    def load_scores(self, guild_id: int) -> Dict[str, Dict[str, int]]:
-        """Load scores for a specific server.
+    def _get_scores_mtime(self, scores_path: str) -> Optional[int]:
+        """Get a scores file's modification time in nanoseconds, or None if it doesn't exist."""
+        try:
+            return os.stat(scores_path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _read_scores(self, guild_id: int) -> Dict[str, Dict[str, int]]:
+        """Get the cached scores for a server, rereading the file only when it changed.
+        
+        The returned dict is shared with the cache and must not be modified; use
+        load_scores for a copy that can be changed and saved.
         
         Args:
             guild_id: Discord guild ID
@@ -40,32 +81,87 @@ class ScoreManager:
         Returns:
             Dictionary mapping user_id (as string) to their stats dictionary
         """
+        if guild_id in self._dirty:
+            # Newer than the file until the next flush
+            self._scores_cache.move_to_end(guild_id)
+            return self._scores_cache[guild_id][1]
+        
         scores_path = self._get_scores_path(guild_id)
+        mtime = self._get_scores_mtime(scores_path)
+        if mtime is None:
+            return {}
         
-        if os.path.exists(scores_path):
-            try:
-                with open(scores_path, 'r', encoding='utf-8') as f:
-                    scores = json.load(f)
-                # Ensure all stats exist for all players
-                for user_id, stats in scores.items():
-                    for stat_name in self.STAT_NAMES:
-                        if stat_name not in stats:
-                            stats[stat_name] = 0
-                    # Ensure XP exists
-                    if "xp" not in stats:
-                        stats["xp"] = 0
-                    # Ensure achievements_unlocked exists as list
-                    if "achievements_unlocked" not in stats:
-                        stats["achievements_unlocked"] = []
-                    elif not isinstance(stats["achievements_unlocked"], list):
-                        # Convert old format to list if needed
-                        stats["achievements_unlocked"] = []
-                return scores
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading scores for guild {guild_id}: {e}")
-                return {}
-        
-        return {}
+        cached = self._scores_cache.get(guild_id)
+        if cached is not None and cached[0] == mtime:
+            self._scores_cache.move_to_end(guild_id)
+            return cached[1]
+        
+        try:
+            with open(scores_path, 'rb') as f:
+                scores = json_codec.loads(f.read())
+            self._fill_missing_stats(scores)
+        except (json.JSONDecodeError, IOError) as e:
+            # Not cached, so a fixed file is picked up on the next read
+            print(f"Error loading scores for guild {guild_id}: {e}")
+            return {}
+        
+        self._cache_scores(guild_id, mtime, scores)
+        return scores
+    
+    def _cache_scores(self, guild_id: int, mtime: Optional[int], scores: Dict[str, Dict[str, int]]) -> None:
+        """Cache a server's scores as most recently used, evicting the least recently used.
+        
+        Servers with unsaved changes are never evicted; they become evictable once flushed.
+        
+        Args:
+            guild_id: Discord guild ID
+            mtime: Modification time of the scores file the scores match, or None
+            scores: Dictionary mapping user_id (as string) to their stats dictionary
+        """
+        self._scores_cache[guild_id] = (mtime, scores)
+        self._scores_cache.move_to_end(guild_id)
+        
+        if len(self._scores_cache) > self.CACHE_SIZE:
+            for old_guild_id in self._scores_cache:
+                if old_guild_id not in self._dirty:
+                    del self._scores_cache[old_guild_id]
+                    break
+    
+    def _fill_missing_stats(self, scores: Dict[str, Dict[str, int]]) -> None:
+        """Add any missing stats, XP and achievements list to every player, in place.
+        
+        Args:
+            scores: Dictionary mapping user_id (as string) to their stats dictionary
+        """
+        # Ensure all stats exist for all players
+        for user_id, stats in scores.items():
+            for stat_name in self.STAT_NAMES:
+                if stat_name not in stats:
+                    stats[stat_name] = 0
+            # Ensure XP exists
+            if "xp" not in stats:
+                stats["xp"] = 0
+            # Ensure achievements_unlocked exists as list
+            if "achievements_unlocked" not in stats:
+                stats["achievements_unlocked"] = []
+            elif not isinstance(stats["achievements_unlocked"], list):
+                # Convert old format to list if needed
+                stats["achievements_unlocked"] = []
+    
+    def load_scores(self, guild_id: int) -> Dict[str, Dict[str, int]]:
+        """Load scores for a specific server.
+        
+        Args:
+            guild_id: Discord guild ID
+            
+        Returns:
+            Dictionary mapping user_id (as string) to their stats dictionary
+        """
+        # Copy each player's stats (and achievements list) so changes don't leak into the cache
+        return {
+            user_id: {**stats, "achievements_unlocked": list(stats["achievements_unlocked"])}
+            for user_id, stats in self._read_scores(guild_id).items()
+        }
     
     def save_scores(self, guild_id: int, scores: Dict[str, Dict[str, int]]) -> bool:
         """Save scores for a specific server.
@@ -78,37 +174,94 @@ class ScoreManager:
             True if successful, False otherwise
         """
         scores_path = self._get_scores_path(guild_id)
+        temp_path = scores_path + ".tmp"
         
         try:
-            with open(scores_path, 'w', encoding='utf-8') as f:
-                json.dump(scores, f, indent=2, ensure_ascii=False)
+            data = json_codec.dumps(scores)
+            # Write to a temp file and swap it in so a crash never leaves a half-written file
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, scores_path)
+            # Cache what a reread of the file would produce
+            self._fill_missing_stats(scores)
+            self._cache_scores(guild_id, self._get_scores_mtime(scores_path), scores)
+            self._versions[guild_id] = self._versions.get(guild_id, 0) + 1
             return True
         except IOError as e:
             print(f"Error saving scores for guild {guild_id}: {e}")
             return False
     
-    def _ensure_player_stats(self, guild_id: int, user_id: int) -> Dict[str, int]:
-        """Ensure a player has all stats initialized. Returns the stats dict."""
-        scores = self.load_scores(guild_id)
+    def _queue_save(self, guild_id: int, scores: Dict[str, Dict[str, int]]) -> bool:
+        """Make changed scores current and write them shortly, coalescing bursts of updates.
+        
+        Outside a running event loop the scores are written immediately.
+        
+        Args:
+            guild_id: Discord guild ID
+            scores: Dictionary mapping user_id (as string) to their stats dictionary
+            
+        Returns:
+            True if the scores were saved or queued, False if an immediate save failed
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self.save_scores(guild_id, scores)
+        
+        self._fill_missing_stats(scores)
+        cached = self._scores_cache.get(guild_id)
+        self._dirty.add(guild_id)
+        self._cache_scores(guild_id, cached[0] if cached is not None else None, scores)
+        self._versions[guild_id] = self._versions.get(guild_id, 0) + 1
+        
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.SAVE_DELAY, self.flush)
+        return True
+    
+    def flush(self) -> None:
+        """Write every server's queued score changes to disk.
+        
+        Servers whose save fails stay queued, and another flush is scheduled to retry them.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        for guild_id in list(self._dirty):
+            if self.save_scores(guild_id, self._scores_cache[guild_id][1]):
+                self._dirty.discard(guild_id)
+        
+        if self._dirty:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return  # At exit, nothing left to retry with
+            self._flush_handle = loop.call_later(self.SAVE_DELAY, self.flush)
+    
+    def get_version(self, guild_id: int) -> int:
+        """Get a counter that changes whenever a server's scores are saved.
+        
+        Args:
+            guild_id: Discord guild ID
+            
+        Returns:
+            Number of successful saves for the server since startup
+        """
+        return self._versions.get(guild_id, 0)
+    
+    def _ensure_player_stats(self, scores: Dict[str, Dict[str, int]], user_id: int) -> Dict[str, int]:
+        """Ensure a player has all stats initialized in a loaded scores dict. Returns the stats dict."""
         user_id_str = str(user_id)
+        stats = scores.get(user_id_str)
         
-        if user_id_str not in scores:
-            scores[user_id_str] = {stat: 0 for stat in self.STAT_NAMES}
-            scores[user_id_str]["xp"] = 0
-            scores[user_id_str]["achievements_unlocked"] = []
-        else:
-            # Ensure all stats exist
-            for stat_name in self.STAT_NAMES:
-                if stat_name not in scores[user_id_str]:
-                    scores[user_id_str][stat_name] = 0
-            if "xp" not in scores[user_id_str]:
-                scores[user_id_str]["xp"] = 0
-            if "achievements_unlocked" not in scores[user_id_str]:
-                scores[user_id_str]["achievements_unlocked"] = []
-            elif not isinstance(scores[user_id_str]["achievements_unlocked"], list):
-                scores[user_id_str]["achievements_unlocked"] = []
-        
-        return scores[user_id_str]
+        if stats is None:
+            stats = self.DEFAULT_STATS.copy()
+            stats["xp"] = 0
+            stats["achievements_unlocked"] = []
+            scores[user_id_str] = stats
+        
+        # Players read from disk already have every stat filled in
+        return stats
     
     def update_player_score(self, guild_id: int, user_id: int, stat_name: str, value: int) -> bool:
         """Update a specific stat for a player.
@@ -122,25 +275,15 @@ class ScoreManager:
         Returns:
             True if successful, False otherwise
         """
-        if stat_name not in self.STAT_NAMES:
+        if stat_name not in self.STAT_NAME_SET:
             return False
         
         scores = self.load_scores(guild_id)
-        user_id_str = str(user_id)
-        
-        # Ensure player exists in the scores dict
-        if user_id_str not in scores:
-            scores[user_id_str] = {stat: 0 for stat in self.STAT_NAMES}
-        else:
-            # Ensure all stats exist
-            for stat in self.STAT_NAMES:
-                if stat not in scores[user_id_str]:
-                    scores[user_id_str][stat] = 0
         
         # Update the stat
-        scores[user_id_str][stat_name] = value
+        self._ensure_player_stats(scores, user_id)[stat_name] = value
         
-        return self.save_scores(guild_id, scores)
+        return self._queue_save(guild_id, scores)
     
     def increment_player_score(self, guild_id: int, user_id: int, stat_name: str, amount: int = 1) -> bool:
         """Increment a stat for a player.
@@ -154,26 +297,15 @@ class ScoreManager:
         Returns:
             True if successful, False otherwise
         """
-        if stat_name not in self.STAT_NAMES:
+        if stat_name not in self.STAT_NAME_SET:
             return False
         
         scores = self.load_scores(guild_id)
-        user_id_str = str(user_id)
-        
-        # Ensure player exists in the scores dict
-        if user_id_str not in scores:
-            scores[user_id_str] = {stat: 0 for stat in self.STAT_NAMES}
-        else:
-            # Ensure all stats exist
-            for stat in self.STAT_NAMES:
-                if stat not in scores[user_id_str]:
-                    scores[user_id_str][stat] = 0
         
         # Increment the stat
-        current_value = scores[user_id_str].get(stat_name, 0)
-        scores[user_id_str][stat_name] = current_value + amount
+        self._ensure_player_stats(scores, user_id)[stat_name] += amount
         
-        return self.save_scores(guild_id, scores)
+        return self._queue_save(guild_id, scores)
     
     def get_player_stats(self, guild_id: int, user_id: int) -> Dict[str, int]:
         """Get all stats for a player.
@@ -185,14 +317,14 @@ class ScoreManager:
         Returns:
             Dictionary of stat names to values
         """
-        scores = self.load_scores(guild_id)
+        scores = self._read_scores(guild_id)
         user_id_str = str(user_id)
         
         if user_id_str in scores:
             return scores[user_id_str].copy()
         else:
             # Return default stats
-            return {stat: 0 for stat in self.STAT_NAMES}
+            return self.DEFAULT_STATS.copy()
     
     def get_leaderboard(self, guild_id: int, stat_name: str, limit: int = 10) -> List[Tuple[int, int]]:
         """Get top N players for a stat.
@@ -205,23 +337,17 @@ class ScoreManager:
         Returns:
             List of tuples (user_id, stat_value) sorted by stat_value descending
         """
-        if stat_name not in self.STAT_NAMES:
+        if stat_name not in self.STAT_NAME_SET:
             return []
         
-        scores = self.load_scores(guild_id)
-        
-        # Build list of (user_id, stat_value) tuples
-        leaderboard = []
-        for user_id_str, stats in scores.items():
-            user_id = int(user_id_str)
-            stat_value = stats.get(stat_name, 0)
-            leaderboard.append((user_id, stat_value))
-        
-        # Sort by stat value descending
-        leaderboard.sort(key=lambda x: x[1], reverse=True)
+        scores = self._read_scores(guild_id)
         
-        # Return top N
-        return leaderboard[:limit]
+        # Top N by stat value descending, ties in file order (same as a stable sort)
+        return heapq.nlargest(
+            limit,
+            ((int(user_id_str), stats.get(stat_name, 0)) for user_id_str, stats in scores.items()),
+            key=itemgetter(1),
+        )
     
     def get_player_rank(self, guild_id: int, user_id: int, stat_name: str) -> Optional[int]:
         """Get a player's rank for a stat (1-based, None if not found).
@@ -234,24 +360,63 @@ class ScoreManager:
         Returns:
             Rank (1-based) or None if player not found
         """
-        if stat_name not in self.STAT_NAMES:
+        if stat_name not in self.STAT_NAME_SET:
             return None
         
-        scores = self.load_scores(guild_id)
+        scores = self._read_scores(guild_id)
         user_id_str = str(user_id)
         
         if user_id_str not in scores:
             return None
         
-        # Get all players sorted by stat value
-        leaderboard = self.get_leaderboard(guild_id, stat_name, limit=10000)  # Get all
+        return self._rank_in(scores, user_id_str, stat_name)
+    
+    def get_player_ranks(self, guild_id: int, user_id: int) -> Dict[str, int]:
+        """Get a player's rank for every stat from a single scores read.
+        
+        Ranks match get_player_rank: players are ordered by stat value descending,
+        with ties kept in the order they appear in the scores file.
+        
+        Args:
+            guild_id: Discord guild ID
+            user_id: Discord user ID
+            
+        Returns:
+            Dictionary of stat names to ranks (1-based), empty if player not found
+        """
+        scores = self._read_scores(guild_id)
+        user_id_str = str(user_id)
+        
+        if user_id_str not in scores:
+            return {}
         
-        # Find player's rank
-        for rank, (uid, _) in enumerate(leaderboard, start=1):
-            if uid == user_id:
-                return rank
+        return {stat_name: self._rank_in(scores, user_id_str, stat_name) for stat_name in self.STAT_NAMES}
+    
+    def _rank_in(self, scores: Dict[str, Dict[str, int]], user_id_str: str, stat_name: str) -> int:
+        """Rank a player present in scores for one stat without sorting.
         
-        return None
+        Players ahead are those with a higher value, or an equal value earlier in the
+        scores file, matching the order get_leaderboard returns.
+        
+        Args:
+            scores: Dictionary mapping user_id (as string) to their stats dictionary
+            user_id_str: Discord user ID as a string
+            stat_name: Name of the stat to rank by
+            
+        Returns:
+            Rank (1-based)
+        """
+        player_value = scores[user_id_str].get(stat_name, 0)
+        ahead = 0
+        before_player = True
+        for other_id_str, stats in scores.items():
+            if other_id_str == user_id_str:
+                before_player = False
+                continue
+            value = stats.get(stat_name, 0)
+            if value > player_value or (before_player and value == player_value):
+                ahead += 1
+        return ahead + 1
     
     def award_xp(self, guild_id: int, user_id: int, amount: int) -> bool:
         """Award XP to a player and check for level ups.
@@ -265,28 +430,24 @@ class ScoreManager:
             True if successful, False otherwise
         """
         scores = self.load_scores(guild_id)
-        user_id_str = str(user_id)
-        
-        # Ensure player exists
-        if user_id_str not in scores:
-            scores[user_id_str] = {stat: 0 for stat in self.STAT_NAMES}
-            scores[user_id_str]["xp"] = 0
-            scores[user_id_str]["achievements_unlocked"] = []
-        else:
-            # Ensure XP exists
-            if "xp" not in scores[user_id_str]:
-                scores[user_id_str]["xp"] = 0
         
         # Award XP
-        old_level = self.get_player_level(guild_id, user_id)
-        scores[user_id_str]["xp"] = scores[user_id_str].get("xp", 0) + amount
-        new_level = self.get_player_level(guild_id, user_id)
+        self._ensure_player_stats(scores, user_id)["xp"] += amount
         
-        # Save scores
-        success = self.save_scores(guild_id, scores)
+        return self._queue_save(guild_id, scores)
+    
+    def get_player_xp(self, guild_id: int, user_id: int) -> int:
+        """Get a player's XP without copying their stats.
         
-        # Return True if level up occurred
-        return success
+        Args:
+            guild_id: Discord guild ID
+            user_id: Discord user ID
+            
+        Returns:
+            Player XP (0 if player not found)
+        """
+        stats = self._read_scores(guild_id).get(str(user_id))
+        return stats.get("xp", 0) if stats is not None else 0
     
     def get_player_level(self, guild_id: int, user_id: int) -> int:
         """Calculate player level from XP.
@@ -300,12 +461,11 @@ class ScoreManager:
         Returns:
             Player level (minimum 1)
         """
-        stats = self.get_player_stats(guild_id, user_id)
-        xp = stats.get("xp", 0)
+        xp = self.get_player_xp(guild_id, user_id)
         if xp <= 0:
             return 1
-        level = int(math.sqrt(xp / 100)) + 1
-        return max(1, level)
+        # Integer square root, same as int(sqrt(xp / 100)) without the float round trip
+        return math.isqrt(int(xp) // 100) + 1
     
     def get_achievements(self, guild_id: int, user_id: int) -> List[str]:
         """Get list of unlocked achievement IDs for a player.
@@ -317,7 +477,7 @@ class ScoreManager:
         Returns:
             List of achievement IDs
         """
-        scores = self.load_scores(guild_id)
+        scores = self._read_scores(guild_id)
         user_id_str = str(user_id)
         
         if user_id_str in scores:
@@ -340,33 +500,20 @@ class ScoreManager:
             True if achievement was newly unlocked, False if already unlocked
         """
         scores = self.load_scores(guild_id)
-        user_id_str = str(user_id)
-        
-        # Ensure player exists
-        if user_id_str not in scores:
-            scores[user_id_str] = {stat: 0 for stat in self.STAT_NAMES}
-            scores[user_id_str]["xp"] = 0
-            scores[user_id_str]["achievements_unlocked"] = []
-        else:
-            if "achievements_unlocked" not in scores[user_id_str]:
-                scores[user_id_str]["achievements_unlocked"] = []
-            elif not isinstance(scores[user_id_str]["achievements_unlocked"], list):
-                scores[user_id_str]["achievements_unlocked"] = []
+        stats = self._ensure_player_stats(scores, user_id)
         
         # Check if already unlocked
-        if achievement_id in scores[user_id_str]["achievements_unlocked"]:
+        if achievement_id in stats["achievements_unlocked"]:
             return False
         
         # Unlock achievement
-        scores[user_id_str]["achievements_unlocked"].append(achievement_id)
+        stats["achievements_unlocked"].append(achievement_id)
         
         # Award XP reward
         if xp_reward > 0:
-            if "xp" not in scores[user_id_str]:
-                scores[user_id_str]["xp"] = 0
-            scores[user_id_str]["xp"] += xp_reward
+            stats["xp"] += xp_reward
         
-        return self.save_scores(guild_id, scores)
+        return self._queue_save(guild_id, scores)
     
     def check_achievements(self, guild_id: int, user_id: int, stats: Dict[str, int]) -> List[Tuple[str, int]]:
         """Check if any achievements should be unlocked based on current stats.
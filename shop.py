@@ -2,7 +2,9 @@
 
 import os
 import json
-from typing import Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+import json_codec
 
 
 # Shop items definition
@@ -29,6 +31,8 @@ SHOP_ITEMS = {
         "max_stack": 5
     },
 }
+# Read-only view of the shop items, handed out instead of a copy
+SHOP_ITEMS_VIEW = MappingProxyType(SHOP_ITEMS)
 
 
 class ShopManager:
@@ -56,16 +60,15 @@ class ShopManager:
         """
         inventory_path = self._get_inventory_path(guild_id)
         
-        if os.path.exists(inventory_path):
-            try:
-                with open(inventory_path, 'r', encoding='utf-8') as f:
-                    inventory = json.load(f)
-                return inventory
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading inventory for guild {guild_id}: {e}")
-                return {}
-        
-        return {}
+        try:
+            with open(inventory_path, 'rb') as f:
+                inventory = json_codec.loads(f.read())
+            return inventory
+        except FileNotFoundError:
+            return {}  # No purchases on this server yet
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error loading inventory for guild {guild_id}: {e}")
+            return {}
     
     def save_inventory(self, guild_id: int, inventory: Dict[str, Dict[str, int]]) -> bool:
         """Save inventory for a specific server.
@@ -78,22 +81,26 @@ class ShopManager:
             True if successful, False otherwise
         """
         inventory_path = self._get_inventory_path(guild_id)
+        temp_path = inventory_path + ".tmp"
         
         try:
-            with open(inventory_path, 'w', encoding='utf-8') as f:
-                json.dump(inventory, f, indent=2, ensure_ascii=False)
+            data = json_codec.dumps(inventory)
+            # Write to a temp file and swap it in so a crash never leaves a half-written file
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, inventory_path)
             return True
         except IOError as e:
             print(f"Error saving inventory for guild {guild_id}: {e}")
             return False
     
-    def get_shop_items(self) -> Dict[str, Dict]:
+    def get_shop_items(self) -> Mapping[str, Dict]:
         """Get all available shop items.
         
         Returns:
-            Dictionary of shop items
+            Read-only mapping of shop items
         """
-        return SHOP_ITEMS.copy()
+        return SHOP_ITEMS_VIEW
     
     def get_player_inventory(self, guild_id: int, user_id: int) -> Dict[str, int]:
         """Get purchased items count for a player.